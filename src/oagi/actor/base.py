@@ -6,6 +6,9 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import hashlib
+import time
+from collections import OrderedDict
 from uuid import uuid4
 
 from ..constants import (
@@ -13,9 +16,11 @@ from ..constants import (
     MAX_STEPS_ALLOWED_ACTOR,
     MAX_STEPS_ALLOWED_THINKER,
     MODEL_THINKER,
+    SCREENSHOT_URL_CACHE_SIZE,
 )
 from ..logging import get_logger
 from ..types import URL, Image, Step
+from ..types.models import UploadFileResponse
 from ..utils.prompt_builder import build_prompt
 
 logger = get_logger("actor.base")
@@ -38,6 +43,8 @@ class BaseActor:
         self.message_history: list = []  # OpenAI-compatible message history
         self.max_steps: int = DEFAULT_MAX_STEPS
         self.current_step: int = 0  # Current step counter
+        # Screenshot content hash -> (download_url, file_expires_at), LRU-bounded
+        self._screenshot_url_cache: OrderedDict[bytes, tuple[str, int]] = OrderedDict()
         # Client will be set by subclasses
         self.api_key: str | None = None
         self.base_url: str | None = None
@@ -106,11 +113,39 @@ class BaseActor:
             return screenshot
         return None
 
+    @staticmethod
+    def _screenshot_key(screenshot_bytes: bytes) -> bytes:
+        return hashlib.blake2b(screenshot_bytes, digest_size=16).digest()
+
+    def _get_cached_screenshot_url(self, key: bytes) -> str | None:
+        """Return the download URL of an identical, still-valid earlier upload."""
+        entry = self._screenshot_url_cache.get(key)
+        if entry is None:
+            return None
+        download_url, file_expires_at = entry
+        if file_expires_at <= time.time():
+            del self._screenshot_url_cache[key]
+            return None
+        self._screenshot_url_cache.move_to_end(key)
+        return download_url
+
+    def _cache_screenshot_url(
+        self, key: bytes, upload_response: UploadFileResponse
+    ) -> None:
+        self._screenshot_url_cache[key] = (
+            upload_response.download_url,
+            upload_response.file_expires_at,
+        )
+        if len(self._screenshot_url_cache) > SCREENSHOT_URL_CACHE_SIZE:
+            self._screenshot_url_cache.popitem(last=False)
+
     def _ensure_screenshot_url_sync(
         self, screenshot: Image | URL | bytes, client
     ) -> str:
         """Get screenshot URL, uploading to S3 if needed (sync version).
 
+        Identical screenshots (e.g. on a retried step) reuse the earlier upload.
+
         Args:
             screenshot: Screenshot as Image object, URL string, or raw bytes
             client: SyncClient instance for S3 upload
@@ -121,8 +156,12 @@ class BaseActor:
         screenshot_url = self._get_screenshot_url(screenshot)
         if screenshot_url is None:
             screenshot_bytes = self._prepare_screenshot(screenshot)
-            upload_response = client.put_s3_presigned_url(screenshot_bytes)
-            screenshot_url = upload_response.download_url
+            key = self._screenshot_key(screenshot_bytes)
+            screenshot_url = self._get_cached_screenshot_url(key)
+            if screenshot_url is None:
+                upload_response = client.put_s3_presigned_url(screenshot_bytes)
+                self._cache_screenshot_url(key, upload_response)
+                screenshot_url = upload_response.download_url
         return screenshot_url
 
     async def _ensure_screenshot_url_async(
@@ -130,6 +169,8 @@ class BaseActor:
     ) -> str:
         """Get screenshot URL, uploading to S3 if needed (async version).
 
+        Identical screenshots (e.g. on a retried step) reuse the earlier upload.
+
         Args:
             screenshot: Screenshot as Image object, URL string, or raw bytes
             client: AsyncClient instance for S3 upload
@@ -140,30 +181,38 @@ class BaseActor:
         screenshot_url = self._get_screenshot_url(screenshot)
         if screenshot_url is None:
             screenshot_bytes = self._prepare_screenshot(screenshot)
-            upload_response = await client.put_s3_presigned_url(screenshot_bytes)
-            screenshot_url = upload_response.download_url
+            key = self._screenshot_key(screenshot_bytes)
+            screenshot_url = self._get_cached_screenshot_url(key)
+            if screenshot_url is None:
+                upload_response = await client.put_s3_presigned_url(screenshot_bytes)
+                self._cache_screenshot_url(key, upload_response)
+                screenshot_url = upload_response.download_url
         return screenshot_url
 
-    def _add_user_message_to_history(
+    def _build_user_message(
         self, screenshot_url: str, prompt: str | None = None
-    ):
-        """Add user message with screenshot to message history.
+    ) -> dict:
+        """Build the user message with screenshot for the next step.
+
+        The message is only appended to message_history once the step succeeds,
+        so a failed request never leaves a dangling user turn behind.
 
         Args:
             screenshot_url: URL of the screenshot
             prompt: Optional prompt text (for first message only)
+
+        Returns:
+            OpenAI-compatible user message dict
         """
         content = []
         if prompt:
             content.append({"type": "text", "text": prompt})
         content.append({"type": "image_url", "image_url": {"url": screenshot_url}})
 
-        self.message_history.append(
-            {
-                "role": "user",
-                "content": content,
-            }
-        )
+        return {
+            "role": "user",
+            "content": content,
+        }
 
     def _add_assistant_message_to_history(self, raw_output: str):
         """Add assistant response to message history.
@@ -66,15 +66,18 @@ class Actor(BaseActor):
 
         try:
             screenshot_url = self._ensure_screenshot_url_sync(screenshot, self.client)
-            self._add_user_message_to_history(screenshot_url, self._build_step_prompt())
+            user_message = self._build_user_message(
+                screenshot_url, self._build_step_prompt()
+            )
 
             step, raw_output, usage = self.client.chat_completion(
                 model=self.model,
-                messages=self.message_history,
+                messages=[*self.message_history, user_message],
                 temperature=self._get_temperature(temperature),
                 task_id=self.task_id,
             )
 
+            self.message_history.append(user_message)
             self._add_assistant_message_to_history(raw_output)
             self._log_step_completion(step)
             return step
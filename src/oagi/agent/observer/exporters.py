@@ -10,6 +10,7 @@ import base64
 import json
 from pathlib import Path
 
+from ...exceptions import check_optional_dependency
 from ...types import (
     Action,
     ActionEvent,
@@ -25,6 +26,13 @@ from ...types import (
     parse_scroll,
 )
 
+if check_optional_dependency(
+    "orjson", "Fast JSON export", "fast-json", raise_error=False
+):
+    import orjson
+else:
+    orjson = None
+
 
 def _parse_action_coords(action: Action) -> dict | None:
     """Parse coordinates from action argument for cursor indicators.
@@ -198,21 +206,19 @@ def _convert_events_for_html(events: list[ObserverEvent]) -> list[dict]:
 
         match event:
             case StepEvent():
+                actions = event.step.actions or ()
                 # Collect action coordinates for cursor indicators
-                action_coords = []
-                actions_list = []
-                if event.step.actions:
-                    for action in event.step.actions:
-                        coords = _parse_action_coords(action)
-                        if coords:
-                            action_coords.append(coords)
-                        actions_list.append(
-                            {
-                                "type": action.type.value,
-                                "argument": action.argument,
-                                "count": action.count or 1,
-                            }
-                        )
+                action_coords = [
+                    coords for coords in map(_parse_action_coords, actions) if coords
+                ]
+                actions_list = [
+                    {
+                        "type": action.type.value,
+                        "argument": action.argument,
+                        "count": action.count or 1,
+                    }
+                    for action in actions
+                ]
 
                 # Handle image
                 image_data = None
@@ -339,4 +345,11 @@ def export_to_json(events: list[ObserverEvent], path: str) -> None:
             event_dict = event.model_dump(mode="json")
         json_events.append(event_dict)
 
-    output_path.write_text(json.dumps(json_events, indent=2, default=str))
+    # The stdlib encoder falls back to pure Python when indenting, which
+    # dominates long trajectory dumps; orjson indents natively
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(json_events, default=str, option=orjson.OPT_INDENT_2)
+        )
+    else:
+        output_path.write_text(json.dumps(json_events, indent=2, default=str))
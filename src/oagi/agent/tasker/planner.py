@@ -7,6 +7,7 @@
 # -----------------------------------------------------------------------------
 
 import json
+from operator import attrgetter
 from typing import Any
 
 from ...client import AsyncClient
@@ -15,6 +16,9 @@ from ...types import URL, Image, extract_uuid_from_url
 from .memory import PlannerMemory
 from .models import Action, PlannerOutput, ReflectionOutput
 
+# Fields copied from each Action into a reflection window step
+_WINDOW_STEP_FIELDS = attrgetter("action_type", "target", "reasoning")
+
 
 class Planner:
     """Planner for task decomposition and reflection.
@@ -226,12 +230,14 @@ class Planner:
         # Convert actions to window_steps format
         window_steps = [
             {
-                "step_number": i + 1,
-                "action_type": action.action_type,
-                "target": action.target or "",
-                "reasoning": action.reasoning or "",
+                "step_number": i,
+                "action_type": action_type,
+                "target": target or "",
+                "reasoning": reasoning or "",
             }
-            for i, action in enumerate(window_actions)
+            for i, (action_type, target, reasoning) in enumerate(
+                map(_WINDOW_STEP_FIELDS, window_actions), 1
+            )
         ]
 
         # Extract screenshot UUIDs from window actions
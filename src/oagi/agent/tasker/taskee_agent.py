@@ -330,7 +330,7 @@ class TaskeeAgent(AsyncAgent):
 
                 for action in step.actions:
                     self._record_action(
-                        action_type=action.type.lower(),
+                        action_type=action.type.value,
                         target=action.argument,
                         reasoning=step.reason,
                         screenshot_uuid=screenshot_uuid,
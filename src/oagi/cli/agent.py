@@ -317,7 +317,7 @@ def run_agent(args: argparse.Namespace) -> None:
     agent = create_agent(**agent_kwargs)
 
     # Create image provider
-    image_provider = AsyncScreenshotMaker()
+    image_provider = AsyncScreenshotMaker(handler=action_handler)
 
     if target_screen:
         # Set the target screen for the image and action provider
@@ -12,7 +12,7 @@ from datetime import datetime
 from oagi.types import Action, ActionEvent, ObserverEvent, StepEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class StepData:
     step_num: int
     timestamp: datetime
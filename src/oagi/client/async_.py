@@ -6,7 +6,8 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
-from functools import wraps
+import asyncio
+from typing import Any
 
 import httpx
 from httpx import AsyncHTTPTransport
@@ -15,9 +16,15 @@ from openai import AsyncOpenAI
 from ..constants import (
     API_V1_FILE_UPLOAD_ENDPOINT,
     API_V1_GENERATE_ENDPOINT,
+    DEFAULT_BATCH_CONCURRENCY,
     DEFAULT_MAX_RETRIES,
     HTTP_CLIENT_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
 )
+from ..exceptions import APIError
 from ..logging import get_logger
 from ..platform_info import get_sdk_headers
 from ..types import Image
@@ -28,22 +35,6 @@ from .base import BaseClient
 logger = get_logger("async_client")
 
 
-def async_log_trace_on_failure(func):
-    """Async decorator that logs trace ID when a method fails."""
-
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            # Try to get response from the exception if it has one
-            if (response := getattr(e, "response", None)) is not None:
-                BaseClient._log_trace_id(response)
-            raise
-
-    return wrapper
-
-
 class AsyncClient(BaseClient[httpx.AsyncClient]):
     """Asynchronous HTTP client for the OAGI API."""
 
@@ -67,16 +58,35 @@ class AsyncClient(BaseClient[httpx.AsyncClient]):
         )
 
         # httpx clients for S3 uploads and other endpoints (with retries)
-        transport = AsyncHTTPTransport(retries=self.max_retries)
+        # Keep-alive pooling and HTTP/2 avoid a TCP+TLS handshake per request
+        transport = AsyncHTTPTransport(
+            retries=self.max_retries,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
         self.http_client = httpx.AsyncClient(
-            transport=transport, base_url=self.base_url, headers=sdk_headers
+            transport=transport,
+            base_url=self.base_url,
+            headers=sdk_headers,
+            event_hooks={"response": [self._on_response]},
         )
+        # S3 PUTs share the transport (and its connection pool) but not the
+        # SDK headers, which presigned storage URLs have no use for
         self.upload_client = httpx.AsyncClient(
-            transport=transport, timeout=HTTP_CLIENT_TIMEOUT
+            transport=transport,
+            timeout=httpx.Timeout(HTTP_CLIENT_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
         )
 
         logger.info(f"AsyncClient initialized with base_url: {self.base_url}")
 
+    async def _on_response(self, response: httpx.Response) -> None:
+        """httpx response hook capturing trace IDs for failure logging."""
+        self._store_trace_ids(response)
+
     async def __aenter__(self):
         return self
 
@@ -139,47 +149,49 @@ class AsyncClient(BaseClient[httpx.AsyncClient]):
                 API_V1_FILE_UPLOAD_ENDPOINT, headers=headers, timeout=self.timeout
             )
             return self._process_upload_response(response)
-        except (httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError) as e:
+        except self._UPLOAD_HTTP_ERRORS as e:
             self._handle_upload_http_errors(e, getattr(e, "response", None))
 
     async def upload_to_s3(
         self,
         url: str,
-        content: bytes | Image,
+        content: bytes | memoryview | Image,
     ) -> None:
         """
         Upload image bytes to S3 using presigned URL
 
+        The body is streamed in chunks rather than handed to httpx as one buffer.
+
         Args:
             url: S3 presigned URL
-            content: Image bytes or Image object to upload
+            content: Image bytes, memoryview, or Image object to upload
 
         Raises:
             APIError: If upload fails
         """
         logger.debug("Async uploading image to S3")
 
-        # Convert Image to bytes if needed
-        if isinstance(content, Image):
-            content = content.read()
+        view, headers = self._prepare_upload_body(content)
 
         response = None
         try:
-            response = await self.upload_client.put(url=url, content=content)
+            response = await self.upload_client.put(
+                url=url, content=self._aiter_upload_chunks(view), headers=headers
+            )
             response.raise_for_status()
         except Exception as e:
             self._handle_s3_upload_error(e, response)
 
     async def put_s3_presigned_url(
         self,
-        screenshot: bytes | Image,
+        screenshot: bytes | memoryview | Image,
         api_version: str | None = None,
     ) -> UploadFileResponse:
         """
         Get S3 presigned URL and upload image (convenience method)
 
         Args:
-            screenshot: Screenshot image bytes or Image object
+            screenshot: Screenshot image bytes, memoryview, or Image object
             api_version: API version header
 
         Returns:
@@ -189,7 +201,6 @@ class AsyncClient(BaseClient[httpx.AsyncClient]):
         await self.upload_to_s3(upload_file_response.url, screenshot)
         return upload_file_response
 
-    @async_log_trace_on_failure
     async def call_worker(
         self,
         worker_id: str,
@@ -257,10 +268,42 @@ class AsyncClient(BaseClient[httpx.AsyncClient]):
         try:
             response = await self.http_client.post(
                 API_V1_GENERATE_ENDPOINT,
-                json=payload,
-                headers=headers,
+                content=self._encode_json(payload),
+                headers={**headers, "Content-Type": "application/json"},
                 timeout=self.timeout,
             )
             return self._process_generate_response(response)
         except (httpx.TimeoutException, httpx.NetworkError) as e:
             self._handle_upload_http_errors(e)
+        except APIError:
+            self._log_last_trace_ids()
+            raise
+
+    async def call_workers_batch(
+        self,
+        requests: list[dict[str, Any]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[GenerateResponse]:
+        """Call the /v1/generate endpoint for several worker requests concurrently.
+
+        Args:
+            requests: List of keyword-argument dicts, one per call_worker() call
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of GenerateResponse in the same order as requests
+
+        Raises:
+            ValueError: If concurrency is less than 1 or a worker_id is invalid
+            APIError: If any API call returns an error
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _call(request: dict[str, Any]) -> GenerateResponse:
+            async with semaphore:
+                return await self.call_worker(**request)
+
+        return list(await asyncio.gather(*(_call(r) for r in requests)))
@@ -6,7 +6,11 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import json
 import os
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextvars import ContextVar
+from types import MappingProxyType
 from typing import Any, Generic, TypeVar
 
 import httpx
@@ -16,6 +20,7 @@ from ..constants import (
     DEFAULT_BASE_URL,
     DEFAULT_MAX_RETRIES,
     HTTP_CLIENT_TIMEOUT,
+    UPLOAD_CHUNK_SIZE,
 )
 from ..exceptions import (
     APIError,
@@ -27,9 +32,11 @@ from ..exceptions import (
     RequestTimeoutError,
     ServerError,
     ValidationError,
+    check_optional_dependency,
 )
 from ..logging import get_logger
 from ..platform_info import get_sdk_headers
+from ..types import Image
 from ..types.models import (
     ErrorResponse,
     GenerateResponse,
@@ -39,11 +46,23 @@ from ..types.models import (
 from ..types.models.step import Step
 from ..utils.output_parser import parse_raw_output
 
+if check_optional_dependency(
+    "orjson", "Fast JSON encoding", "fast-json", raise_error=False
+):
+    import orjson
+else:
+    orjson = None
+
 logger = get_logger("client.base")
 
 # TypeVar for HTTP client type (httpx.Client or httpx.AsyncClient)
 HttpClientT = TypeVar("HttpClientT")
 
+# (request_id, trace_id) of the most recent response seen in the current context
+_last_trace_ids: ContextVar[tuple[str, str]] = ContextVar(
+    "oagi_last_trace_ids", default=("", "")
+)
+
 
 class BaseClient(Generic[HttpClientT]):
     """Base class with shared business logic for sync/async clients."""
@@ -70,22 +89,42 @@ class BaseClient(Generic[HttpClientT]):
         self.timeout = HTTP_CLIENT_TIMEOUT
         self.max_retries = max_retries
         self.client: HttpClientT  # Will be set by subclasses
+        # Static chat completion kwargs keyed by (model, temperature)
+        self._chat_kwargs_cache: dict[tuple[str, float | None], dict] = {}
+        # Request headers keyed by api_version
+        self._header_cache: dict[str | None, Mapping[str, str]] = {}
 
         logger.info(f"Client initialized with base_url: {self.base_url}")
 
-    def _build_headers(self, api_version: str | None = None) -> dict[str, str]:
-        headers = get_sdk_headers()
-        if api_version:
-            headers["x-api-version"] = api_version
-        if self.api_key:
-            headers["x-api-key"] = self.api_key
+    def _build_headers(self, api_version: str | None = None) -> Mapping[str, str]:
+        # Headers only vary by api_version, so build each variant once and hand
+        # out a read-only view (httpx copies request headers anyway)
+        headers = self._header_cache.get(api_version)
+        if headers is None:
+            built = get_sdk_headers()
+            if api_version:
+                built["x-api-version"] = api_version
+            if self.api_key:
+                built["x-api-key"] = self.api_key
+            headers = self._header_cache[api_version] = MappingProxyType(built)
         return headers
 
     @staticmethod
-    def _log_trace_id(response) -> None:
-        """Log trace IDs from response headers for debugging."""
-        logger.error(f"Request Id: {response.headers.get('x-request-id', '')}")
-        logger.error(f"Trace Id: {response.headers.get('x-trace-id', '')}")
+    def _store_trace_ids(response: httpx.Response) -> None:
+        """Remember trace IDs of a response for logging on a later failure."""
+        _last_trace_ids.set(
+            (
+                response.headers.get("x-request-id", ""),
+                response.headers.get("x-trace-id", ""),
+            )
+        )
+
+    @staticmethod
+    def _log_last_trace_ids() -> None:
+        """Log trace IDs captured from the most recent response in this context."""
+        request_id, trace_id = _last_trace_ids.get()
+        logger.error(f"Request Id: {request_id}")
+        logger.error(f"Trace Id: {trace_id}")
 
     def _build_chat_completion_kwargs(
         self,
@@ -105,9 +144,15 @@ class BaseClient(Generic[HttpClientT]):
         Returns:
             Dict of kwargs for chat.completions.create()
         """
-        kwargs: dict = {"model": model, "messages": messages}
-        if temperature is not None:
-            kwargs["temperature"] = temperature
+        key = (model, temperature)
+        base = self._chat_kwargs_cache.get(key)
+        if base is None:
+            base = {"model": model}
+            if temperature is not None:
+                base["temperature"] = temperature
+            self._chat_kwargs_cache[key] = base
+
+        kwargs: dict = {**base, "messages": messages}
         if task_id is not None:
             kwargs["extra_body"] = {"task_id": task_id}
         return kwargs
@@ -236,6 +281,39 @@ class BaseClient(Generic[HttpClientT]):
                 response=response,
             )
 
+    def _raise_timeout_error(
+        self, e: Exception, response: httpx.Response | None = None
+    ) -> None:
+        logger.error(f"Request timed out after {self.timeout} seconds")
+        raise RequestTimeoutError(f"Request timed out after {self.timeout} seconds", e)
+
+    def _raise_network_error(
+        self, e: Exception, response: httpx.Response | None = None
+    ) -> None:
+        logger.error(f"Network error: {e}")
+        raise NetworkError(f"Network error: {e}", e)
+
+    def _raise_status_error(
+        self, e: Exception, response: httpx.Response | None = None
+    ) -> None:
+        if not response:
+            return
+        logger.warning(f"Invalid status code: {e}")
+        exception_class = self._get_exception_class(response.status_code)
+        raise exception_class(
+            f"API error (status {response.status_code})",
+            status_code=response.status_code,
+            response=response,
+        )
+
+    # httpx exception type -> handler, checked in order by _handle_upload_http_errors
+    _UPLOAD_ERROR_HANDLERS = (
+        (httpx.TimeoutException, _raise_timeout_error),
+        (httpx.NetworkError, _raise_network_error),
+        (httpx.HTTPStatusError, _raise_status_error),
+    )
+    _UPLOAD_HTTP_ERRORS = tuple(exc_type for exc_type, _ in _UPLOAD_ERROR_HANDLERS)
+
     def _handle_upload_http_errors(
         self, e: Exception, response: httpx.Response | None = None
     ):
@@ -250,24 +328,44 @@ class BaseClient(Generic[HttpClientT]):
             NetworkError: If network error occurs
             APIError: For other HTTP errors
         """
-        if isinstance(e, httpx.TimeoutException):
-            logger.error(f"Request timed out after {self.timeout} seconds")
-            raise RequestTimeoutError(
-                f"Request timed out after {self.timeout} seconds", e
-            )
-        elif isinstance(e, httpx.NetworkError):
-            logger.error(f"Network error: {e}")
-            raise NetworkError(f"Network error: {e}", e)
-        elif isinstance(e, httpx.HTTPStatusError) and response:
-            logger.warning(f"Invalid status code: {e}")
-            exception_class = self._get_exception_class(response.status_code)
-            raise exception_class(
-                f"API error (status {response.status_code})",
-                status_code=response.status_code,
-                response=response,
-            )
-        else:
-            raise
+        for exc_type, handler in self._UPLOAD_ERROR_HANDLERS:
+            if isinstance(e, exc_type):
+                handler(self, e, response)
+                break
+        raise
+
+    @staticmethod
+    def _prepare_upload_body(
+        content: bytes | memoryview | Image,
+    ) -> tuple[memoryview, dict[str, str]]:
+        """Wrap upload content in a memoryview and build its Content-Length header.
+
+        The view is sent in UPLOAD_CHUNK_SIZE slices so the body is streamed
+        without extra copies. S3 presigned PUTs reject chunked transfer
+        encoding, so the explicit Content-Length is required.
+
+        Args:
+            content: Image bytes, memoryview, or Image object to upload
+
+        Returns:
+            Tuple of (byte view of the content, headers for the PUT request)
+        """
+        if isinstance(content, Image):
+            content = content.read()
+        view = memoryview(content).cast("B")
+        return view, {"Content-Length": str(view.nbytes)}
+
+    @staticmethod
+    def _iter_upload_chunks(view: memoryview) -> Iterator[memoryview]:
+        """Yield zero-copy slices of an upload body."""
+        for start in range(0, view.nbytes, UPLOAD_CHUNK_SIZE):
+            yield view[start : start + UPLOAD_CHUNK_SIZE]
+
+    @staticmethod
+    async def _aiter_upload_chunks(view: memoryview) -> AsyncIterator[memoryview]:
+        """Async variant of _iter_upload_chunks for httpx.AsyncClient."""
+        for start in range(0, view.nbytes, UPLOAD_CHUNK_SIZE):
+            yield view[start : start + UPLOAD_CHUNK_SIZE]
 
     def _handle_s3_upload_error(
         self, e: Exception, response: httpx.Response | None = None
@@ -285,6 +383,20 @@ class BaseClient(Generic[HttpClientT]):
         status_code = response.status_code if response else 500
         raise APIError(message=str(e), status_code=status_code, response=response)
 
+    @staticmethod
+    def _encode_json(payload: Any) -> bytes:
+        """Serialize a JSON request body, using orjson when it is installed.
+
+        Args:
+            payload: JSON-serializable request payload
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
     def _prepare_worker_request(
         self,
         worker_id: str,
@@ -302,7 +414,7 @@ class BaseClient(Generic[HttpClientT]):
         prior_notes: str | None = None,
         latest_todo_summary: str | None = None,
         api_version: str | None = None,
-    ) -> tuple[dict[str, Any], dict[str, str]]:
+    ) -> tuple[dict[str, Any], Mapping[str, str]]:
         """Prepare worker request with validation, payload, and headers.
 
         Args:
@@ -6,7 +6,11 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
-from functools import wraps
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 import httpx
 from httpx import HTTPTransport
@@ -15,9 +19,18 @@ from openai import OpenAI
 from ..constants import (
     API_V1_FILE_UPLOAD_ENDPOINT,
     API_V1_GENERATE_ENDPOINT,
+    DEFAULT_BATCH_CONCURRENCY,
     DEFAULT_MAX_RETRIES,
     HTTP_CLIENT_TIMEOUT,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    PRESIGNED_URL_BURST_WINDOW,
+    PRESIGNED_URL_EXPIRY_MARGIN,
+    PRESIGNED_URL_POOL_SIZE,
 )
+from ..exceptions import APIError, OAGIError
 from ..logging import get_logger
 from ..platform_info import get_sdk_headers
 from ..types import Image
@@ -28,22 +41,6 @@ from .base import BaseClient
 logger = get_logger("sync_client")
 
 
-def log_trace_on_failure(func):
-    """Decorator that logs trace ID when a method fails."""
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            # Try to get response from the exception if it has one
-            if (response := getattr(e, "response", None)) is not None:
-                BaseClient._log_trace_id(response)
-            raise
-
-    return wrapper
-
-
 class SyncClient(BaseClient[httpx.Client]):
     """Synchronous HTTP client for the OAGI API."""
 
@@ -67,13 +64,38 @@ class SyncClient(BaseClient[httpx.Client]):
         )
 
         # httpx clients for S3 uploads and other endpoints (with retries)
-        transport = HTTPTransport(retries=self.max_retries)
+        # Keep-alive pooling and HTTP/2 avoid a TCP+TLS handshake per request
+        transport = HTTPTransport(
+            retries=self.max_retries,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
         self.http_client = httpx.Client(
-            transport=transport, base_url=self.base_url, headers=sdk_headers
+            transport=transport,
+            base_url=self.base_url,
+            headers=sdk_headers,
+            event_hooks={"response": [self._store_trace_ids]},
         )
+        # S3 PUTs share the transport (and its connection pool) but not the
+        # SDK headers, which presigned storage URLs have no use for
         self.upload_client = httpx.Client(
-            transport=transport, timeout=HTTP_CLIENT_TIMEOUT
+            transport=transport,
+            timeout=httpx.Timeout(HTTP_CLIENT_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        )
+        # Background workers for presigned URL prefetches
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="oagi-upload"
         )
+        # Prefetched presigned URLs and last upload start time per api_version
+        self._url_pool: dict[str | None, deque[UploadFileResponse]] = {}
+        self._last_upload_at: dict[str | None, float] = {}
+        self._url_pool_lock = threading.Lock()
+        self._url_prefetching: set[str | None] = set()
+        self._closed = False
 
         logger.info(f"SyncClient initialized with base_url: {self.base_url}")
 
@@ -85,6 +107,9 @@ class SyncClient(BaseClient[httpx.Client]):
 
     def close(self):
         """Close the underlying clients."""
+        # Pending prefetches are abandoned rather than waited for
+        self._closed = True
+        self._upload_executor.shutdown(wait=False, cancel_futures=True)
         self.openai_client.close()
         self.http_client.close()
         self.upload_client.close()
@@ -139,57 +164,118 @@ class SyncClient(BaseClient[httpx.Client]):
                 API_V1_FILE_UPLOAD_ENDPOINT, headers=headers, timeout=self.timeout
             )
             return self._process_upload_response(response)
-        except (httpx.TimeoutException, httpx.NetworkError, httpx.HTTPStatusError) as e:
+        except self._UPLOAD_HTTP_ERRORS as e:
             self._handle_upload_http_errors(e, getattr(e, "response", None))
 
     def upload_to_s3(
         self,
         url: str,
-        content: bytes | Image,
+        content: bytes | memoryview | Image,
     ) -> None:
         """
         Upload image bytes to S3 using presigned URL
 
+        The body is streamed in chunks rather than handed to httpx as one buffer.
+
         Args:
             url: S3 presigned URL
-            content: Image bytes or Image object to upload
+            content: Image bytes, memoryview, or Image object to upload
 
         Raises:
             APIError: If upload fails
         """
         logger.debug("Uploading image to S3")
 
-        # Convert Image to bytes if needed
-        if isinstance(content, Image):
-            content = content.read()
+        view, headers = self._prepare_upload_body(content)
 
         response = None
         try:
-            response = self.upload_client.put(url=url, content=content)
+            response = self.upload_client.put(
+                url=url, content=self._iter_upload_chunks(view), headers=headers
+            )
             response.raise_for_status()
         except Exception as e:
             self._handle_s3_upload_error(e, response)
 
     def put_s3_presigned_url(
         self,
-        screenshot: bytes | Image,
+        screenshot: bytes | memoryview | Image,
         api_version: str | None = None,
     ) -> UploadFileResponse:
         """
         Get S3 presigned URL and upload image (convenience method)
 
         Args:
-            screenshot: Screenshot image bytes or Image object
+            screenshot: Screenshot image bytes, memoryview, or Image object
             api_version: API version header
 
         Returns:
             UploadFileResponse: The response from /v1/file/upload with uuid and presigned S3 URL
         """
-        upload_file_response = self.get_s3_presigned_url(api_version)
+        upload_file_response = self._acquire_presigned_url(api_version)
         self.upload_to_s3(upload_file_response.url, screenshot)
         return upload_file_response
 
-    @log_trace_on_failure
+    def _acquire_presigned_url(self, api_version: str | None) -> UploadFileResponse:
+        """Take a presigned URL from the pool, or fetch one if it is empty.
+
+        When uploads arrive in a burst, the pool is topped back up in the
+        background so the next upload can skip the /v1/file/upload round trip.
+        Isolated uploads fetch one URL each, as if there were no pool.
+        """
+        now = time.monotonic()
+        with self._url_pool_lock:
+            last_upload_at = self._last_upload_at.get(api_version)
+            self._last_upload_at[api_version] = now
+        upload_file_response = self._take_pooled_presigned_url(api_version)
+        if upload_file_response is None:
+            upload_file_response = self.get_s3_presigned_url(api_version)
+        if (
+            last_upload_at is not None
+            and now - last_upload_at < PRESIGNED_URL_BURST_WINDOW
+        ):
+            self._schedule_presigned_url_prefetch(api_version)
+        return upload_file_response
+
+    def _take_pooled_presigned_url(
+        self, api_version: str | None
+    ) -> UploadFileResponse | None:
+        fresh_after = time.time() + PRESIGNED_URL_EXPIRY_MARGIN
+        with self._url_pool_lock:
+            pool = self._url_pool.get(api_version)
+            while pool:
+                upload_file_response = pool.popleft()
+                if upload_file_response.expires_at > fresh_after:
+                    return upload_file_response
+        return None
+
+    def _schedule_presigned_url_prefetch(self, api_version: str | None) -> None:
+        with self._url_pool_lock:
+            pool = self._url_pool.setdefault(api_version, deque())
+            if (
+                self._closed
+                or api_version in self._url_prefetching
+                or len(pool) >= PRESIGNED_URL_POOL_SIZE
+            ):
+                return
+            self._url_prefetching.add(api_version)
+        self._upload_executor.submit(self._prefetch_presigned_urls, api_version)
+
+    def _prefetch_presigned_urls(self, api_version: str | None) -> None:
+        try:
+            while (
+                not self._closed
+                and len(self._url_pool[api_version]) < PRESIGNED_URL_POOL_SIZE
+            ):
+                upload_file_response = self.get_s3_presigned_url(api_version)
+                with self._url_pool_lock:
+                    self._url_pool[api_version].append(upload_file_response)
+        except OAGIError as e:
+            logger.debug(f"Presigned URL prefetch failed: {e}")
+        finally:
+            with self._url_pool_lock:
+                self._url_prefetching.discard(api_version)
+
     def call_worker(
         self,
         worker_id: str,
@@ -257,10 +343,45 @@ class SyncClient(BaseClient[httpx.Client]):
         try:
             response = self.http_client.post(
                 API_V1_GENERATE_ENDPOINT,
-                json=payload,
-                headers=headers,
+                content=self._encode_json(payload),
+                headers={**headers, "Content-Type": "application/json"},
                 timeout=self.timeout,
             )
             return self._process_generate_response(response)
         except (httpx.TimeoutException, httpx.NetworkError) as e:
             self._handle_upload_http_errors(e)
+        except APIError:
+            self._log_last_trace_ids()
+            raise
+
+    def call_workers_batch(
+        self,
+        requests: list[dict[str, Any]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[GenerateResponse]:
+        """Call the /v1/generate endpoint for several worker requests concurrently.
+
+        Requests run on a thread pool and share this client's connection pool,
+        so the batch takes roughly as long as its slowest call.
+
+        Args:
+            requests: List of keyword-argument dicts, one per call_worker() call
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List of GenerateResponse in the same order as requests
+
+        Raises:
+            ValueError: If concurrency is less than 1 or a worker_id is invalid
+            APIError: If any API call returns an error
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="oagi-worker"
+        ) as executor:
+            futures = [
+                executor.submit(self.call_worker, **request) for request in requests
+            ]
+            return [future.result() for future in futures]
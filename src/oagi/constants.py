@@ -43,6 +43,29 @@ DEFAULT_TEMPERATURE_LOW = 0.1
 
 # Timeout Values
 HTTP_CLIENT_TIMEOUT = 60
+HTTP_CONNECT_TIMEOUT = 5.0
+
+# Chunk size for streaming screenshot uploads to S3
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Presigned upload URL pool: each URL targets a fresh object UUID, so during a
+# burst of uploads a few are fetched ahead of time and handed out once each
+PRESIGNED_URL_POOL_SIZE = 2
+# Uploads started within this many seconds of the previous one form a burst
+PRESIGNED_URL_BURST_WINDOW = 2.0
+# Pooled URLs are discarded this many seconds before their expires_at
+PRESIGNED_URL_EXPIRY_MARGIN = 5.0
+
+# Download URLs of recently uploaded screenshots, keyed by content hash
+SCREENSHOT_URL_CACHE_SIZE = 32
+
+# Connection Pool Limits
+HTTP_MAX_CONNECTIONS = 40
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 30.0
 
 # Retry Configuration
 DEFAULT_MAX_RETRIES = 2
+
+# Concurrency limit for batched worker calls
+DEFAULT_BATCH_CONCURRENCY = 8
@@ -11,8 +11,11 @@ This module provides the abstract base class for converting model-specific
 actions to pyautogui command strings for remote execution.
 """
 
+import logging
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
 from ..handler.capslock_manager import CapsLockManager
@@ -26,6 +29,11 @@ from ..handler.utils import (
 
 T = TypeVar("T")
 
+_TERMINAL = frozenset({"DONE", "FAIL"})
+_WAIT_RE = re.compile(r"^WAIT\((?P<sec>[0-9]*\.?[0-9]+)\)$", re.IGNORECASE)
+# Code routed to the pyautogui runtime (also PynputController and _smart_paste)
+_CODE_RE = re.compile(r"pyautogui|pynputcontroller|_smart_paste", re.IGNORECASE)
+
 
 class BaseActionConverter(ABC, Generic[T]):
     """Abstract base class for action converters.
@@ -57,16 +65,8 @@ class BaseActionConverter(ABC, Generic[T]):
         self.config = config or PyautoguiConfig()
         self.logger = logger
 
-        # Initialize coordinate scaler
-        self._coord_scaler = CoordinateScaler(
-            source_width=self.coord_width,
-            source_height=self.coord_height,
-            target_width=self.config.sandbox_width,
-            target_height=self.config.sandbox_height,
-        )
-
-        # Initialize caps lock manager
-        self.caps_manager = CapsLockManager(mode=self.config.capslock_mode)
+        # Coordinate scaler and caps lock manager are created on first use,
+        # see the cached properties below
 
         # Track last cursor position (for actions without explicit coordinates)
         self._last_x: int | None = None
@@ -84,12 +84,31 @@ class BaseActionConverter(ABC, Generic[T]):
         """Input coordinate space height (e.g., 768 for XGA, 1000 for OAGI)."""
         ...
 
-    @property
+    @cached_property
+    def _coord_scaler(self) -> CoordinateScaler:
+        """Coordinate scaler from model space to sandbox space (created lazily)."""
+        return CoordinateScaler(
+            source_width=self.coord_width,
+            source_height=self.coord_height,
+            target_width=self.config.sandbox_width,
+            target_height=self.config.sandbox_height,
+        )
+
+    @cached_property
+    def caps_manager(self) -> CapsLockManager:
+        """Caps lock state manager (created lazily)."""
+        return CapsLockManager(mode=self.config.capslock_mode)
+
+    # The scaler's target never changes for a converter, so the factors are
+    # cached into the instance dict on first access and read as plain
+    # attributes afterwards
+
+    @cached_property
     def scale_x(self) -> float:
         """X scaling factor from input to sandbox coordinates."""
         return self._coord_scaler.scale_x
 
-    @property
+    @cached_property
     def scale_y(self) -> float:
         """Y scaling factor from input to sandbox coordinates."""
         return self._coord_scaler.scale_y
@@ -97,6 +116,9 @@ class BaseActionConverter(ABC, Generic[T]):
     def scale_coordinate(self, x: int | float, y: int | float) -> tuple[int, int]:
         """Scale coordinates from model space to sandbox space.
 
+        Delegates to CoordinateScaler.scale so converters and handlers
+        round the same coordinate to the same pixel.
+
         Args:
             x: X coordinate in model space
             y: Y coordinate in model space
@@ -150,20 +172,35 @@ class BaseActionConverter(ABC, Generic[T]):
             return self._last_x, self._last_y
         return self.config.sandbox_width // 2, self.config.sandbox_height // 2
 
-    def _log_error(self, message: str) -> None:
-        """Log an error message if logger is available."""
-        if self.logger:
-            self.logger.error(message)
-
-    def _log_info(self, message: str) -> None:
-        """Log an info message if logger is available."""
-        if self.logger:
-            self.logger.info(message)
+    def _log_enabled(self, level: int) -> bool:
+        """Check whether the logger would emit a message at the given level.
 
-    def _log_debug(self, message: str) -> None:
-        """Log a debug message if logger is available."""
-        if self.logger:
-            self.logger.debug(message)
+        Loggers without ``isEnabledFor`` (e.g. loguru or simple test doubles)
+        are treated as enabled for every level.
+        """
+        if not self.logger:
+            return False
+        is_enabled_for = getattr(self.logger, "isEnabledFor", None)
+        return is_enabled_for is None or is_enabled_for(level)
+
+    def _log_error(self, message: str | Callable[[], str]) -> None:
+        """Log an error message if logger is available and ERROR is enabled."""
+        if self._log_enabled(logging.ERROR):
+            self.logger.error(message() if callable(message) else message)
+
+    def _log_info(self, message: str | Callable[[], str]) -> None:
+        """Log an info message if logger is available and INFO is enabled."""
+        if self._log_enabled(logging.INFO):
+            self.logger.info(message() if callable(message) else message)
+
+    def _log_debug(self, message: str | Callable[[], str]) -> None:
+        """Log a debug message if logger is available and DEBUG is enabled.
+
+        Pass a zero-argument callable to defer building an expensive message
+        until it is known to be emitted.
+        """
+        if self._log_enabled(logging.DEBUG):
+            self.logger.debug(message() if callable(message) else message)
 
     def __call__(self, actions: list[T]) -> list[str]:
         """Convert actions to list of pyautogui command strings.
@@ -184,27 +221,48 @@ class BaseActionConverter(ABC, Generic[T]):
         if not actions:
             return converted
 
-        for action in actions:
-            try:
-                action_strings = self._convert_single_action(action)
+        # Bind per-iteration lookups once; skipped no-ops are only collected
+        # when they would actually be logged
+        convert = self._convert_single_action
+        extend = converted.extend
+        track_skipped = self._log_enabled(logging.DEBUG)
 
-                if not action_strings:
+        def record_failure(action: T, error: Exception) -> None:
+            action_repr = repr(action)
+            self._log_error(
+                lambda: f"Failed to convert action: {action_repr}, error: {error}"
+            )
+            failed.append((action_repr, str(error)))
+
+        # Fast path: a single handler around the whole loop. On the first
+        # failure, record it and finish the rest with per-action handling.
+        index = 0
+        try:
+            for action in actions:
+                action_strings = convert(action)
+                if action_strings:
+                    extend(action_strings)
+                elif track_skipped:
                     # No-op action (e.g., screenshot, cursor_position)
-                    action_type = getattr(action, "action_type", repr(action))
-                    skipped.append(str(action_type))
+                    skipped.append(str(getattr(action, "action_type", repr(action))))
+                index += 1
+        except Exception as e:
+            record_failure(actions[index], e)
+            for action in actions[index + 1 :]:
+                try:
+                    action_strings = convert(action)
+                except Exception as e:
+                    record_failure(action, e)
                     continue
-
-                converted.extend(action_strings)
-
-            except Exception as e:
-                action_repr = repr(action)
-                self._log_error(f"Failed to convert action: {action_repr}, error: {e}")
-                failed.append((action_repr, str(e)))
+                if action_strings:
+                    extend(action_strings)
+                elif track_skipped:
+                    skipped.append(str(getattr(action, "action_type", repr(action))))
 
         if skipped:
-            self._log_debug(f"Skipped no-op actions: {skipped}")
+            self._log_debug(lambda: f"Skipped no-op actions: {skipped}")
 
-        if not converted and actions and failed:
+        if failed and not converted:
             raise RuntimeError(
                 f"All action conversions failed ({len(failed)}/{len(actions)}): {failed}"
             )
@@ -250,25 +308,18 @@ class BaseActionConverter(ABC, Generic[T]):
         action_str = str(action).strip()
 
         # Special markers
-        upper = action_str.upper()
-        if upper in ["DONE", "FAIL"]:
+        if len(action_str) == 4 and action_str.upper() in _TERMINAL:
             return {"type": "sleep", "parameters": {"seconds": 0}}
 
-        # WAIT(seconds)
-        wait_match = re.match(
-            r"^WAIT\((?P<sec>[0-9]*\.?[0-9]+)\)$", action_str, re.IGNORECASE
-        )
-        if wait_match:
-            seconds = float(wait_match.group("sec"))
-            return {"type": "sleep", "parameters": {"seconds": seconds}}
+        # WAIT(seconds) - cheap prefix check so most strings skip the regex
+        if action_str[:5].upper() == "WAIT(":
+            wait_match = _WAIT_RE.match(action_str)
+            if wait_match:
+                seconds = float(wait_match.group("sec"))
+                return {"type": "sleep", "parameters": {"seconds": seconds}}
 
         # pyautogui code path - also handles PynputController and _smart_paste
-        action_lower = action_str.lower()
-        if (
-            "pyautogui" in action_lower
-            or "pynputcontroller" in action_lower
-            or "_smart_paste" in action_lower
-        ):
+        if _CODE_RE.search(action_str):
             return {
                 "type": "pyautogui",
                 "parameters": {"code": action_str},
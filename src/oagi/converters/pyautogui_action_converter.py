@@ -13,7 +13,8 @@ to pyautogui command strings for remote execution via the sandbox runtime API.
 
 import logging
 import re
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from ..handler.capslock_manager import CapsLockManager
 from ..handler.utils import PYAUTOGUI_VALID_KEYS, PyautoguiConfig, make_type_command
@@ -29,6 +30,71 @@ MODEL_COORD_HEIGHT = 1000
 # of 100 on Linux) because commands execute in the remote sandbox VM.
 DEFAULT_CONVERTER_SCROLL_AMOUNT = 2
 
+# Command templates, %-formatted with already-rounded int coordinates
+_CLICK_TEMPLATES = {
+    ActionType.CLICK: "pyautogui.click(x=%d, y=%d)",
+    ActionType.LEFT_DOUBLE: "pyautogui.doubleClick(x=%d, y=%d)",
+    ActionType.LEFT_TRIPLE: "pyautogui.tripleClick(x=%d, y=%d)",
+    ActionType.RIGHT_SINGLE: "pyautogui.rightClick(x=%d, y=%d)",
+}
+_MOVE_TO_TEMPLATE = "pyautogui.moveTo(%d, %d)"
+_SCROLL_TEMPLATE = "pyautogui.scroll(%d)"
+
+# Scroll direction -> sign applied to the configured scroll amount
+_SCROLL_SIGNS = {"up": 1, "down": -1}
+
+# Key alias -> pyautogui key name, synced from oagi.handler.utils.normalize_key.
+# Covers underscore-separated names models emit (page_down, print_screen, ...)
+# plus Windows, macOS, control and media key aliases.
+_KEY_ALIASES = {
+    **dict.fromkeys(("page_up", "pgup"), "pageup"),
+    **dict.fromkeys(("page_down", "pgdn"), "pagedown"),
+    **dict.fromkeys(("print_screen", "prtsc", "prtscr"), "printscreen"),
+    "num_lock": "numlock",
+    "scroll_lock": "scrolllock",
+    **dict.fromkeys(("caps_lock", "caps"), "capslock"),
+    **dict.fromkeys(("windows", "super", "meta"), "win"),
+    "cmd": "command",
+    # pyautogui uses 'ctrl', not 'control'
+    "control": "ctrl",
+    "mute": "volumemute",
+    "play": "playpause",
+}
+
+# Model outputs that chain several actions in one argument ("x and y")
+_CONJUNCTION_RE = re.compile(" (?:and|then) ", re.IGNORECASE)
+
+# Valid key names that need repr() escaping inside a quoted command argument
+_ESCAPED_KEYS = frozenset({"'", "\\"})
+
+# Suggestions for invalid key names models commonly emit
+_KEY_HINTS = {
+    **dict.fromkeys(("return", "ret"), "use 'enter' or 'return'"),
+    **dict.fromkeys(("delete", "del"), "use 'delete' or 'del'"),
+    **dict.fromkeys(("escape", "esc"), "use 'escape' or 'esc'"),
+}
+
+# Sample of valid key names listed in invalid-hotkey errors
+_VALID_KEYS_SAMPLE = ", ".join(sorted(PYAUTOGUI_VALID_KEYS)[:30])
+
+# WAIT(seconds) marker emitted by _convert_wait
+_WAIT_RE = re.compile(r"^WAIT\((?P<sec>[0-9]*\.?[0-9]+)\)$", re.IGNORECASE)
+
+# Upper bound on memoized hotkey parses per converter
+HOTKEY_CACHE_SIZE = 512
+
+
+def _parse_number(text: str) -> int | float:
+    """Parse a coordinate, returning whole numbers (even "750.0") as ints.
+
+    int() and float() both ignore surrounding whitespace.
+    """
+    try:
+        return int(text)
+    except ValueError:
+        value = float(text)
+        return int(value) if value.is_integer() else value
+
 
 class PyautoguiActionConvertor:
     """Convert OAGI actions to pyautogui command strings.
@@ -71,12 +137,32 @@ class PyautoguiActionConvertor:
         self.sandbox_width = self.pyautogui_config.sandbox_width
         self.sandbox_height = self.pyautogui_config.sandbox_height
 
+        # Scale factors and clamp bounds are fixed per converter, so compute
+        # them once rather than per denormalized coordinate
         self.coord_scale_x = self.sandbox_width / MODEL_COORD_WIDTH
         self.coord_scale_y = self.sandbox_height / MODEL_COORD_HEIGHT
+        self._max_x = self.sandbox_width - 1
+        self._max_y = self.sandbox_height - 1
 
         # Initialize caps lock manager
         self.caps_manager = CapsLockManager(mode=self.pyautogui_config.capslock_mode)
 
+        # Templates with the configured durations baked in
+        self._drag_to_template = (
+            f"pyautogui.dragTo(%d, %d, duration={self.pyautogui_config.drag_duration})"
+        )
+        self._hotkey_suffix = f", interval={self.pyautogui_config.hotkey_interval})"
+        self._capslock_command = "pyautogui.hotkey('capslock'" + self._hotkey_suffix
+        self._default_wait_command = (
+            f"WAIT({float(self.pyautogui_config.wait_duration)})"
+        )
+        self._scroll_amount = self.pyautogui_config.scroll_amount
+
+        # Parsed hotkey argument -> normalized, validated keys
+        self._hotkey_cache: dict[str, tuple[str, ...]] = {}
+        # Hotkey argument -> emitted command, for regular (non-capslock) combos
+        self._hotkey_command_cache: dict[str, str] = {}
+
     def __call__(self, oagi_actions: list[Any]) -> list[tuple[str, bool]]:
         """Convert OAGI actions to list of (action_string, is_last_of_repeat) tuples.
 
@@ -97,11 +183,7 @@ class PyautoguiActionConvertor:
         for action in oagi_actions:
             # Check for duplicate finish()/fail() during iteration
             action_type = getattr(action, "type", None)
-            is_terminal = hasattr(action_type, "value") and action_type.value in (
-                ActionType.FINISH.value,
-                ActionType.FAIL.value,
-            )
-            if is_terminal:
+            if action_type is ActionType.FINISH or action_type is ActionType.FAIL:
                 if has_terminal:
                     raise ValueError(
                         "Duplicate finish()/fail() detected. "
@@ -112,9 +194,11 @@ class PyautoguiActionConvertor:
             try:
                 converted.extend(self._convert_action(action))
             except Exception as e:
-                # Extract action details for better error logging
+                # Action details are only formatted on this failure path
                 action_arg = getattr(action, "argument", "unknown")
-                action_repr = f"{action_type.value if hasattr(action_type, 'value') else action_type}({action_arg})"
+                action_repr = (
+                    f"{getattr(action_type, 'value', action_type)}({action_arg})"
+                )
                 self.logger.error(
                     f"Failed to convert action: {action_repr}, error: {e}"
                 )
@@ -136,23 +220,18 @@ class PyautoguiActionConvertor:
             List of tuples: [(action_string, is_last_of_repeat), ...]
             is_last_of_repeat indicates whether this is the last action in a count>1 sequence
         """
-        if not hasattr(action, "type") or not hasattr(action, "argument"):
-            raise ValueError("Action missing required attribute 'type' or 'argument'")
-        count = getattr(action, "count", None) or 1
-        out: list[tuple[str, bool]] = []
+        count = int(getattr(action, "count", None) or 1)
+        # Parse and scale once; repeats reuse the same command strings
         single_actions = self._convert_single_action(action)
+        if not single_actions or count < 1:
+            return []
 
-        # Repeat the actions count times
-        for i in range(int(count)):
-            is_last_repeat = i == int(count) - 1  # True only on last iteration
-            for j, action_str in enumerate(single_actions):
-                # Only mark the very last command of the very last repeat as is_last
-                is_last = is_last_repeat and (j == len(single_actions) - 1)
-                out.append((action_str, is_last))
-
+        out = [(action_str, False) for action_str in single_actions] * count
+        # Only mark the very last command of the very last repeat as is_last
+        out[-1] = (out[-1][0], True)
         return out
 
-    def _denormalize_coords(self, x: float, y: float) -> tuple[int, int]:
+    def _denormalize_coords(self, x: int | float, y: int | float) -> tuple[int, int]:
         """Convert normalized coordinates to actual sandbox screen coordinates.
 
         Args:
@@ -178,14 +257,27 @@ class PyautoguiActionConvertor:
                 f"Coordinates must be normalized between 0 and {MODEL_COORD_HEIGHT}."
             )
 
-        scaled_x = round(x * self.coord_scale_x)
-        scaled_y = round(y * self.coord_scale_y)
-
-        # Clamp coordinates to ensure valid screen positions (handles edge case at exactly 1000)
-        scaled_x = max(0, min(scaled_x, self.sandbox_width - 1))
-        scaled_y = max(0, min(scaled_y, self.sandbox_height - 1))
+        # Models emit whole numbers almost always; scale those with exact
+        # integer rounding. Inputs are validated non-negative, so only the
+        # upper clamp is needed (handles edge case at exactly 1000).
+        if x.__class__ is int and y.__class__ is int:
+            return (
+                min(
+                    (x * self.sandbox_width + MODEL_COORD_WIDTH // 2)
+                    // MODEL_COORD_WIDTH,
+                    self._max_x,
+                ),
+                min(
+                    (y * self.sandbox_height + MODEL_COORD_HEIGHT // 2)
+                    // MODEL_COORD_HEIGHT,
+                    self._max_y,
+                ),
+            )
 
-        return scaled_x, scaled_y
+        return (
+            max(0, min(round(x * self.coord_scale_x), self._max_x)),
+            max(0, min(round(y * self.coord_scale_y), self._max_y)),
+        )
 
     def _parse_click_coords(self, argument: str) -> tuple[int, int]:
         """Parse click coordinates from argument string.
@@ -200,23 +292,24 @@ class PyautoguiActionConvertor:
             ValueError: If coordinate format is invalid or contains non-numeric values
         """
         # Check for common format errors first
-        if " and " in argument.lower() or " then " in argument.lower():
+        if _CONJUNCTION_RE.search(argument):
             raise ValueError(
                 f"Invalid click format: '{argument}'. "
                 f"Cannot combine multiple actions with 'and' or 'then'. "
                 f"Each action must be separate in the action list."
             )
 
-        parts = argument.split(",") if argument else []
-        if len(parts) < 2:
+        # Only the first two values are used, so partition instead of split
+        first, sep, rest = argument.partition(",")
+        if not sep:
             raise ValueError(
                 f"Invalid click coordinate format: '{argument}'. Expected 'x, y' (comma-separated numeric values)"
             )
         try:
-            x = float(parts[0].strip())
-            y = float(parts[1].strip())
+            x = _parse_number(first)
+            y = _parse_number(rest.partition(",")[0])
             return self._denormalize_coords(x, y)
-        except (ValueError, IndexError) as e:
+        except ValueError as e:
             raise ValueError(
                 f"Failed to parse click coords '{argument}': {e}. "
                 f"Coordinates must be comma-separated numeric values, e.g., 'click(500, 300)'"
@@ -235,7 +328,7 @@ class PyautoguiActionConvertor:
             ValueError: If coordinate format is invalid or contains non-numeric values
         """
         # Check for common format errors first
-        if " and " in argument.lower() or " then " in argument.lower():
+        if _CONJUNCTION_RE.search(argument):
             raise ValueError(
                 f"Invalid drag format: '{argument}'. "
                 f"Cannot combine multiple actions with 'and' or 'then'. "
@@ -249,10 +342,10 @@ class PyautoguiActionConvertor:
                 f"Expected 'x1, y1, x2, y2' (4 comma-separated numeric values)"
             )
         try:
-            sx = float(parts[0].strip())
-            sy = float(parts[1].strip())
-            ex = float(parts[2].strip())
-            ey = float(parts[3].strip())
+            sx = _parse_number(parts[0])
+            sy = _parse_number(parts[1])
+            ex = _parse_number(parts[2])
+            ey = _parse_number(parts[3])
             sx, sy = self._denormalize_coords(sx, sy)
             ex, ey = self._denormalize_coords(ex, ey)
             return sx, sy, ex, ey
@@ -269,41 +362,7 @@ class PyautoguiActionConvertor:
         Handles underscore-separated key names (e.g., page_down -> pagedown).
         """
         key = key.strip().lower()
-
-        # Normalize underscore-separated key names to pyautogui format
-        # This handles common model outputs like page_down, print_screen, etc.
-        # Synced from oagi.handler.utils.normalize_key
-        hotkey_variations_mapping = {
-            "pageup": ["page_up", "pageup", "pgup"],
-            "pagedown": ["page_down", "pagedown", "pgdn"],
-            "printscreen": ["print_screen", "printscreen", "prtsc", "prtscr"],
-            "numlock": ["num_lock", "numlock"],
-            "scrolllock": ["scroll_lock", "scrolllock"],
-            "capslock": ["caps_lock", "caps", "capslock"],
-        }
-        for normalized, variations in hotkey_variations_mapping.items():
-            if key in variations:
-                return normalized
-
-        # Windows-specific key mappings
-        if key in ("windows", "super", "meta"):
-            return "win"  # Windows key
-
-        # macOS-specific key mappings
-        if key == "cmd":
-            return "command"
-
-        # Control key alias (pyautogui uses 'ctrl', not 'control')
-        if key == "control":
-            return "ctrl"
-
-        # Media key aliases
-        if key == "mute":
-            return "volumemute"
-        if key == "play":
-            return "playpause"
-
-        return key
+        return _KEY_ALIASES.get(key, key)
 
     def _validate_keys(self, keys: list[str]) -> None:
         """Validate that all keys are recognized by pyautogui.
@@ -320,21 +379,20 @@ class PyautoguiActionConvertor:
             # Provide helpful suggestions for common mistakes
             suggestions = []
             for invalid_key in invalid_keys:
-                if invalid_key in ("return", "ret"):
-                    suggestions.append(f"'{invalid_key}' → use 'enter' or 'return'")
-                elif invalid_key in ("delete", "del"):
-                    suggestions.append(f"'{invalid_key}' → use 'delete' or 'del'")
-                elif invalid_key in ("escape", "esc"):
-                    suggestions.append(f"'{invalid_key}' → use 'escape' or 'esc'")
-                elif invalid_key.startswith("num") and len(invalid_key) > 3:
-                    suggestions.append(
-                        f"'{invalid_key}' → numpad keys use format 'num0'-'num9'"
-                    )
-                else:
+                hint = _KEY_HINTS.get(invalid_key)
+                if (
+                    hint is None
+                    and invalid_key.startswith("num")
+                    and len(invalid_key) > 3
+                ):
+                    hint = "numpad keys use format 'num0'-'num9'"
+                if hint is None:
                     suggestions.append(f"'{invalid_key}' is not a valid key name")
+                else:
+                    suggestions.append(f"'{invalid_key}' → {hint}")
 
             error_msg = "Invalid key name(s) in hotkey: " + ", ".join(suggestions)
-            error_msg += f"\n\nValid keys include: {', '.join(sorted(list(PYAUTOGUI_VALID_KEYS)[:30]))}... (and more)"
+            error_msg += f"\n\nValid keys include: {_VALID_KEYS_SAMPLE}... (and more)"
             raise ValueError(error_msg)
 
     def _parse_hotkey(self, args_str: str) -> list[str]:
@@ -349,145 +407,180 @@ class PyautoguiActionConvertor:
         Raises:
             ValueError: If any key is invalid
         """
+        # Models repeat the same few combos, so valid parses are memoized
+        cached = self._hotkey_cache.get(args_str)
+        if cached is not None:
+            return list(cached)
+
         # Remove parentheses if present
-        args_str = args_str.strip("()")
+        keys_str = args_str.strip("()")
 
         # Split by '+' or ',' to get individual keys
         # This handles both formats: "ctrl+c" and "alt, tab"
-        if "+" in args_str:
-            keys = [self._normalize_key(key) for key in args_str.split("+")]
+        if "+" in keys_str:
+            keys = [self._normalize_key(key) for key in keys_str.split("+")]
         else:
             # Split by comma (handles "alt, tab" format from model output)
-            keys = [self._normalize_key(key) for key in args_str.split(",")]
+            keys = [self._normalize_key(key) for key in keys_str.split(",")]
 
         # Validate all keys before returning
         self._validate_keys(keys)
 
+        if len(self._hotkey_cache) >= HOTKEY_CACHE_SIZE:
+            self._hotkey_cache.clear()
+        self._hotkey_cache[args_str] = tuple(keys)
         return keys
 
-    def _convert_single_action(self, action: Any) -> list[str]:
-        action_type = action.type.value
-        argument = action.argument or ""
-
-        drag_duration = self.pyautogui_config.drag_duration
-        scroll_default = self.pyautogui_config.scroll_amount
-        wait_default = self.pyautogui_config.wait_duration
-
-        if action_type == ActionType.CLICK.value:
-            x, y = self._parse_click_coords(argument)
-            return [f"pyautogui.click(x={x}, y={y})"]
-
-        if action_type == ActionType.LEFT_DOUBLE.value:
-            x, y = self._parse_click_coords(argument)
-            return [f"pyautogui.doubleClick(x={x}, y={y})"]
-
-        if action_type == ActionType.LEFT_TRIPLE.value:
-            x, y = self._parse_click_coords(argument)
-            return [f"pyautogui.tripleClick(x={x}, y={y})"]
-
-        if action_type == ActionType.RIGHT_SINGLE.value:
-            x, y = self._parse_click_coords(argument)
-            return [f"pyautogui.rightClick(x={x}, y={y})"]
-
-        if action_type == ActionType.DRAG.value:
-            sx, sy, ex, ey = self._parse_drag_coords(argument)
-            return [
-                f"pyautogui.moveTo({sx}, {sy})",
-                f"pyautogui.dragTo({ex}, {ey}, duration={drag_duration})",
-            ]
-
-        if action_type == ActionType.HOTKEY.value:
-            keys = self._parse_hotkey(argument)
-            # Validate keys are not empty (already validated in _parse_hotkey)
-            valid_keys = [k for k in keys if k]
-            if not valid_keys:
-                raise ValueError(
-                    f"Invalid hotkey format: '{argument}'. "
-                    f"Expected key names like 'ctrl+c', 'alt+tab', got empty or invalid keys"
-                )
-            # Check if this is a caps lock key press
-            if len(valid_keys) == 1 and valid_keys[0] == "capslock":
-                if self.caps_manager.should_use_system_capslock():
-                    # System mode: use OS-level caps lock
-                    hotkey_interval = self.pyautogui_config.hotkey_interval
-                    return [f"pyautogui.hotkey('capslock', interval={hotkey_interval})"]
-                else:
-                    # Session mode: toggle internal state (no actual key press needed in conversion)
-                    self.caps_manager.toggle()
-                    return []  # No pyautogui command needed for session mode
-            else:
-                # Regular hotkey combination
-                keys_str = ", ".join(repr(k) for k in valid_keys)
-                hotkey_interval = self.pyautogui_config.hotkey_interval
-                return [f"pyautogui.hotkey({keys_str}, interval={hotkey_interval})"]
-
-        if action_type == ActionType.TYPE.value:
-            text = argument
-
-            # Apply caps lock transformation if needed
-            text = self.caps_manager.transform_text(text)
-            return [make_type_command(text)]
+    def _convert_single_action(self, action: Any) -> tuple[str, ...]:
+        try:
+            action_type = action.type
+            argument = action.argument or ""
+        except AttributeError:
+            raise ValueError(
+                "Action missing required attribute 'type' or 'argument'"
+            ) from None
+        handler = self._ACTION_HANDLERS.get(action_type)
+        if handler is None:
+            # Unknown action type - raise error to guide model
+            raise ValueError(
+                f"Unknown action type: '{getattr(action_type, 'value', action_type)}'. "
+                f"Supported types: click, left_double, left_triple, right_single, drag, "
+                f"hotkey, type, scroll, wait, finish, fail"
+            )
+        return handler(self, action_type, argument)
 
-        if action_type == ActionType.SCROLL.value:
-            parts = [p.strip() for p in argument.split(",")]
-            if len(parts) != 3:
-                raise ValueError(
-                    f"Invalid scroll format: '{argument}'. "
-                    f"Expected 'x, y, direction' (3 comma-separated values), got {len(parts)} parts"
-                )
-            try:
-                x = float(parts[0])
-                y = float(parts[1])
-            except (ValueError, IndexError) as e:
-                raise ValueError(
-                    f"Invalid scroll coordinates: '{argument}'. "
-                    f"x and y must be numeric values, e.g., 'scroll(500, 300, up)'"
-                ) from e
+    def _convert_click(self, action_type: ActionType, argument: str) -> tuple[str, ...]:
+        return (_CLICK_TEMPLATES[action_type] % self._parse_click_coords(argument),)
 
-            x, y = self._denormalize_coords(x, y)
-            direction = parts[2].lower().strip()
+    def _convert_drag(self, action_type: ActionType, argument: str) -> tuple[str, ...]:
+        sx, sy, ex, ey = self._parse_drag_coords(argument)
+        return (
+            _MOVE_TO_TEMPLATE % (sx, sy),
+            self._drag_to_template % (ex, ey),
+        )
 
-            if direction == "up":
-                amount = scroll_default
-            elif direction == "down":
-                amount = -scroll_default
+    def _convert_hotkey(
+        self, action_type: ActionType, argument: str
+    ) -> tuple[str, ...]:
+        command = self._hotkey_command_cache.get(argument)
+        if command is not None:
+            return (command,)
+
+        keys = self._parse_hotkey(argument)
+        # Validate keys are not empty (already validated in _parse_hotkey)
+        valid_keys = [k for k in keys if k]
+        if not valid_keys:
+            raise ValueError(
+                f"Invalid hotkey format: '{argument}'. "
+                f"Expected key names like 'ctrl+c', 'alt+tab', got empty or invalid keys"
+            )
+        # Check if this is a caps lock key press
+        if len(valid_keys) == 1 and valid_keys[0] == "capslock":
+            if self.caps_manager.should_use_system_capslock():
+                # System mode: use OS-level caps lock
+                return (self._capslock_command,)
+            else:
+                # Session mode: toggle internal state (no actual key press needed in conversion)
+                self.caps_manager.toggle()
+                return ()  # No pyautogui command needed for session mode
+        else:
+            # Regular hotkey combination
+            # Validated key names are plain identifiers apart from the quote
+            # and backslash keys, so most combos can be quoted with one join
+            if _ESCAPED_KEYS.isdisjoint(valid_keys):
+                keys_str = "'" + "', '".join(valid_keys) + "'"
             else:
+                keys_str = ", ".join(repr(k) for k in valid_keys)
+            command = "pyautogui.hotkey(" + keys_str + self._hotkey_suffix
+            if len(self._hotkey_command_cache) >= HOTKEY_CACHE_SIZE:
+                self._hotkey_command_cache.clear()
+            self._hotkey_command_cache[argument] = command
+            return (command,)
+
+    def _convert_type(self, action_type: ActionType, argument: str) -> tuple[str, ...]:
+        # Apply caps lock transformation if needed
+        text = self.caps_manager.transform_text(argument)
+        return (make_type_command(text),)
+
+    def _convert_scroll(
+        self, action_type: ActionType, argument: str
+    ) -> tuple[str, ...]:
+        parts = argument.split(",")
+        if len(parts) != 3:
+            raise ValueError(
+                f"Invalid scroll format: '{argument}'. "
+                f"Expected 'x, y, direction' (3 comma-separated values), got {len(parts)} parts"
+            )
+        try:
+            x = _parse_number(parts[0])
+            y = _parse_number(parts[1])
+        except (ValueError, IndexError) as e:
+            raise ValueError(
+                f"Invalid scroll coordinates: '{argument}'. "
+                f"x and y must be numeric values, e.g., 'scroll(500, 300, up)'"
+            ) from e
+
+        x, y = self._denormalize_coords(x, y)
+        # Numbers parse with surrounding whitespace, so only the direction
+        # is stripped; it is only lowercased when the model didn't
+        direction = parts[2].strip()
+        sign = _SCROLL_SIGNS.get(direction)
+        if sign is None:
+            direction = direction.lower()
+            sign = _SCROLL_SIGNS.get(direction)
+            if sign is None:
                 raise ValueError(
                     f"Invalid scroll direction: '{direction}' in '{argument}'. Expected 'up' or 'down'"
                 )
 
-            return [f"pyautogui.moveTo({x}, {y})", f"pyautogui.scroll({amount})"]
+        amount = sign * self._scroll_amount
+        return (_MOVE_TO_TEMPLATE % (x, y), _SCROLL_TEMPLATE % amount)
 
-        if action_type == ActionType.WAIT.value:
-            try:
-                seconds = float(argument) if argument else float(wait_default)
-            except ValueError:
-                raise ValueError(
-                    f"Invalid wait duration: '{argument}'. Expected numeric value in seconds, e.g., 'wait(2.0)'"
-                ) from None
-            return [f"WAIT({seconds})"]
-
-        if action_type == ActionType.FINISH.value:
-            # Task completion action
-            self.logger.info("Task completion action -> DONE")
-            return ["DONE"]
-
-        if action_type == ActionType.FAIL.value:
-            # Task infeasible action
-            self.logger.info("Task infeasible action -> FAIL")
-            return ["FAIL"]
-
-        if action_type == ActionType.CALL_USER.value:
-            # User intervention requested - not an error, just no-op
-            self.logger.info("User intervention requested")
-            return []
-
-        # Unknown action type - raise error to guide model
-        raise ValueError(
-            f"Unknown action type: '{action_type}'. "
-            f"Supported types: click, left_double, left_triple, right_single, drag, "
-            f"hotkey, type, scroll, wait, finish, fail"
-        )
+    def _convert_wait(self, action_type: ActionType, argument: str) -> tuple[str, ...]:
+        if not argument:
+            return (self._default_wait_command,)
+        try:
+            seconds = float(argument)
+        except ValueError:
+            raise ValueError(
+                f"Invalid wait duration: '{argument}'. Expected numeric value in seconds, e.g., 'wait(2.0)'"
+            ) from None
+        return (f"WAIT({seconds})",)
+
+    def _convert_finish(
+        self, action_type: ActionType, argument: str
+    ) -> tuple[str, ...]:
+        # Task completion action
+        self.logger.info("Task completion action -> DONE")
+        return ("DONE",)
+
+    def _convert_fail(self, action_type: ActionType, argument: str) -> tuple[str, ...]:
+        # Task infeasible action
+        self.logger.info("Task infeasible action -> FAIL")
+        return ("FAIL",)
+
+    def _convert_call_user(
+        self, action_type: ActionType, argument: str
+    ) -> tuple[str, ...]:
+        # User intervention requested - not an error, just no-op
+        self.logger.info("User intervention requested")
+        return ()
+
+    # ActionType member -> converter method, looked up once per action
+    _ACTION_HANDLERS: ClassVar[dict[ActionType, Callable[..., tuple[str, ...]]]] = {
+        ActionType.CLICK: _convert_click,
+        ActionType.LEFT_DOUBLE: _convert_click,
+        ActionType.LEFT_TRIPLE: _convert_click,
+        ActionType.RIGHT_SINGLE: _convert_click,
+        ActionType.DRAG: _convert_drag,
+        ActionType.HOTKEY: _convert_hotkey,
+        ActionType.TYPE: _convert_type,
+        ActionType.SCROLL: _convert_scroll,
+        ActionType.WAIT: _convert_wait,
+        ActionType.FINISH: _convert_finish,
+        ActionType.FAIL: _convert_fail,
+        ActionType.CALL_USER: _convert_call_user,
+    }
 
     # ------------------------------------------------------------------
     # Public: convert an action string into a runtime step dict
@@ -507,13 +600,12 @@ class PyautoguiActionConvertor:
         if upper in ["DONE", "FAIL"]:
             return {"type": "sleep", "parameters": {"seconds": 0}}
 
-        # WAIT(seconds)
-        wait_match = re.match(
-            r"^WAIT\((?P<sec>[0-9]*\.?[0-9]+)\)$", action_str, re.IGNORECASE
-        )
-        if wait_match:
-            seconds = float(wait_match.group("sec"))
-            return {"type": "sleep", "parameters": {"seconds": seconds}}
+        # WAIT(seconds) - cheap prefix check so most strings skip the regex
+        if upper.startswith("WAIT("):
+            wait_match = _WAIT_RE.match(action_str)
+            if wait_match:
+                seconds = float(wait_match.group("sec"))
+                return {"type": "sleep", "parameters": {"seconds": seconds}}
 
         # pyautogui code path - use direct execution for better performance
         # This avoids spawning a new Python process for each action
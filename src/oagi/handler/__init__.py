@@ -8,7 +8,7 @@
 import importlib
 from typing import TYPE_CHECKING
 
-from .utils import reset_handler
+from .utils import install_uvloop, reset_handler
 
 # Lazy imports for pyautogui-dependent modules to avoid import errors on headless systems
 _LAZY_IMPORTS: dict[str, str] = {
@@ -59,6 +59,7 @@ __all__ = [
     "ScreenshotMaker",
     "AsyncScreenshotMaker",
     "reset_handler",
+    "install_uvloop",
     "YdotoolConfig",
     "YdotoolActionHandler",
     "AsyncYdotoolActionHandler",
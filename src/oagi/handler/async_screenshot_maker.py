@@ -7,28 +7,32 @@
 # -----------------------------------------------------------------------------
 
 import asyncio
+from typing import Any
 
 from oagi.handler.screen_manager import Screen
 
 from ..types import Image, ImageConfig
 from .screenshot_maker import ScreenshotMaker
+from .utils import ACTION_EXECUTOR
 
 
 class AsyncScreenshotMaker:
     """
-    Async wrapper for ScreenshotMaker that captures screenshots in a thread pool.
+    Async wrapper for ScreenshotMaker that captures screenshots on a worker thread.
 
     This allows screenshot capture to be non-blocking in async contexts,
     enabling concurrent execution of other async tasks while screenshots are taken.
     """
 
-    def __init__(self, config: ImageConfig | None = None):
+    def __init__(self, config: ImageConfig | None = None, handler: Any = None):
         """Initialize with optional image configuration.
 
         Args:
             config: ImageConfig instance for customizing screenshot format and quality
+            handler: Action handler whose deferred post-batch delay is waited
+                out before each capture (see ``defer_post_batch_delay``)
         """
-        self.sync_screenshot_maker = ScreenshotMaker(config=config)
+        self.sync_screenshot_maker = ScreenshotMaker(config=config, handler=handler)
         self.config = config
 
     def set_target_screen(self, screen: Screen) -> None:
@@ -36,7 +40,7 @@ class AsyncScreenshotMaker:
 
     async def __call__(self) -> Image:
         """
-        Capture a screenshot asynchronously using a thread pool executor.
+        Capture a screenshot asynchronously on the shared GUI worker thread.
 
         This prevents screenshot capture from blocking the async event loop,
         allowing other coroutines to run while the screenshot is being taken.
@@ -44,9 +48,10 @@ class AsyncScreenshotMaker:
         Returns:
             Image: The captured screenshot as a PILImage
         """
-        loop = asyncio.get_event_loop()
-        # Run the synchronous screenshot capture in a thread pool to avoid blocking
-        return await loop.run_in_executor(None, self.sync_screenshot_maker)
+        loop = asyncio.get_running_loop()
+        # Capture on the GUI worker thread shared with the action handlers, so
+        # a screenshot never interleaves with a batch of actions
+        return await loop.run_in_executor(ACTION_EXECUTOR, self.sync_screenshot_maker)
 
     async def last_image(self) -> Image:
         return self.sync_screenshot_maker.last_image()
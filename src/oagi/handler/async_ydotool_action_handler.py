@@ -11,6 +11,7 @@ import asyncio
 from oagi.handler.screen_manager import Screen
 
 from ..types import Action
+from .utils import ACTION_EXECUTOR
 from .ydotool_action_handler import YdotoolActionHandler, YdotoolConfig
 
 
@@ -47,6 +48,13 @@ class AsyncYdotoolActionHandler:
         """
         self.sync_handler.reset()
 
+    def wait_for_settle(self) -> None:
+        """Sleep for whatever remains of a deferred post-batch delay.
+
+        Delegates to the underlying synchronous handler's wait_for_settle method.
+        """
+        self.sync_handler.wait_for_settle()
+
     async def __call__(self, actions: list[Action]) -> None:
         """
         Execute actions asynchronously using a thread pool executor.
@@ -57,6 +65,6 @@ class AsyncYdotoolActionHandler:
         Args:
             actions: List of actions to execute
         """
-        loop = asyncio.get_event_loop()
-        # Run the synchronous handler in a thread pool to avoid blocking
-        await loop.run_in_executor(None, self.sync_handler, actions)
+        loop = asyncio.get_running_loop()
+        # Run the synchronous handler on the shared GUI thread to avoid blocking
+        await loop.run_in_executor(ACTION_EXECUTOR, self.sync_handler, actions)
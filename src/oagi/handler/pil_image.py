@@ -72,10 +72,12 @@ class PILImage:
                         "height": region[3],
                     }
                 )
+                # Decode straight from the grabbed buffer; .bgra would first
+                # copy the whole frame into a new bytes object
                 screenshot = PILImageLib.frombytes(
                     "RGB",
                     screenshot_data.size,
-                    screenshot_data.bgra,
+                    screenshot_data.raw,
                     "raw",
                     "BGRX",
                 )
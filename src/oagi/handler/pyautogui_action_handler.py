@@ -6,23 +6,43 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import logging
 import sys
 import time
+from collections.abc import Callable
+from functools import partial
+from typing import ClassVar
 
 from oagi.handler.screen_manager import Screen
 
 from ..exceptions import check_optional_dependency
 from ..types import Action, ActionType, parse_coords, parse_drag_coords, parse_scroll
 from .capslock_manager import CapsLockManager
-from .utils import CoordinateScaler, PyautoguiConfig, normalize_key, parse_hotkey
+from .utils import (
+    CoordinateScaler,
+    PyautoguiConfig,
+    coalesce_type_actions,
+    normalize_key,
+    parse_hotkey,
+)
 
 check_optional_dependency("pyautogui", "PyautoguiActionHandler", "desktop")
 import pyautogui  # noqa: E402
 
-if sys.platform == "darwin":
-    from . import _macos
-elif sys.platform == "win32":
-    from . import _windows
+logger = logging.getLogger(__name__)
+
+# Seconds the target application gets to read pasted text from the clipboard
+# before the previous clipboard contents are restored
+_PASTE_SETTLE_DELAY = 0.1
+
+
+def _click_at_cursor(click_fn):
+    """Adapt a pyautogui click function to the ``(x, y)`` call signature."""
+
+    def click(x: int, y: int) -> None:
+        click_fn()
+
+    return click
 
 
 class PyautoguiActionHandler:
@@ -49,6 +69,9 @@ class PyautoguiActionHandler:
         pyautogui.PAUSE = self.config.action_pause
         # Initialize caps lock manager
         self.caps_manager = CapsLockManager(mode=self.config.capslock_mode)
+        # Monotonic time until which the UI may still be settling after a batch
+        # whose post_batch_delay was deferred to the next screenshot
+        self._settle_until = 0.0
         # The origin position of coordinates (the top-left corner of the target screen)
         self.origin_x, self.origin_y = 0, 0
         # Initialize coordinate scaler (OAGI uses 0-1000 normalized coordinates)
@@ -60,6 +83,29 @@ class PyautoguiActionHandler:
             origin_x=self.origin_x,
             origin_y=self.origin_y,
         )
+        # Resolve platform-specific input functions once instead of per action.
+        # Multi-click functions take the target position; pyautogui's variants
+        # click at the cursor, which _move_and_wait has already positioned.
+        # Platform modules are imported here so that importing this module
+        # does not load the native input bindings.
+        if sys.platform == "darwin":
+            from . import _macos  # noqa: PLC0415
+
+            self._double_click_fn = partial(_macos.macos_click, clicks=2)
+            self._triple_click_fn = partial(_macos.macos_click, clicks=3)
+            self._type_fn = _macos.typewrite_exact
+            self._paste_keys = ("command", "v")
+        else:
+            self._paste_keys = ("ctrl", "v")
+            self._double_click_fn = _click_at_cursor(pyautogui.doubleClick)
+            self._triple_click_fn = _click_at_cursor(pyautogui.tripleClick)
+            # Typing that ignores system capslock, with pyautogui as fallback
+            if sys.platform == "win32":
+                from . import _windows  # noqa: PLC0415
+
+                self._type_fn = _windows.typewrite_exact
+            else:
+                self._type_fn = pyautogui.typewrite
 
     def reset(self):
         """Reset handler state.
@@ -69,6 +115,15 @@ class PyautoguiActionHandler:
         """
         self.caps_manager.reset()
 
+    def wait_for_settle(self) -> None:
+        """Sleep for whatever remains of a deferred post-batch delay.
+
+        Called by a ScreenshotMaker paired with this handler before capturing.
+        """
+        remaining = self._settle_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
     def set_target_screen(self, screen: Screen) -> None:
         """Set the target screen for the action handler.
 
@@ -127,100 +182,134 @@ class PyautoguiActionHandler:
 
     def _move_and_wait(self, x: int, y: int) -> None:
         """Move cursor to position and wait before clicking."""
+        # Repeat clicks often target the cursor's current position; reading it
+        # is far cheaper than a move, which also pays the action pause
+        if pyautogui.position() == (x, y):
+            return
         pyautogui.moveTo(x, y)
-        time.sleep(self.config.click_pre_delay)
+        # moveTo already paused for action_pause; only sleep the remainder
+        remaining = self.config.click_pre_delay - self.config.action_pause
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _do_click(self, arg: str) -> None:
+        x, y = self._parse_coords(arg)
+        self._move_and_wait(x, y)
+        pyautogui.click()
+
+    def _do_double_click(self, arg: str) -> None:
+        x, y = self._parse_coords(arg)
+        self._move_and_wait(x, y)
+        self._double_click_fn(x, y)
+
+    def _do_triple_click(self, arg: str) -> None:
+        x, y = self._parse_coords(arg)
+        self._move_and_wait(x, y)
+        self._triple_click_fn(x, y)
+
+    def _do_right_click(self, arg: str) -> None:
+        x, y = self._parse_coords(arg)
+        self._move_and_wait(x, y)
+        pyautogui.rightClick()
+
+    def _do_drag(self, arg: str) -> None:
+        x1, y1, x2, y2 = self._parse_drag_coords(arg)
+        pyautogui.moveTo(x1, y1)
+        pyautogui.dragTo(x2, y2, duration=self.config.drag_duration, button="left")
+
+    def _do_hotkey(self, arg: str) -> None:
+        keys = self._parse_hotkey(arg)
+        # Check if this is a caps lock key press
+        if len(keys) == 1 and keys[0] == "capslock":
+            if self.caps_manager.should_use_system_capslock():
+                # System mode: use OS-level caps lock
+                pyautogui.hotkey("capslock", interval=self.config.hotkey_interval)
+            else:
+                # Session mode: toggle internal state
+                self.caps_manager.toggle()
+        else:
+            # Regular hotkey combination
+            pyautogui.hotkey(*keys, interval=self.config.hotkey_interval)
+
+    def _do_type(self, arg: str) -> None:
+        # Apply caps lock transformation if needed
+        text = self.caps_manager.transform_text(arg)
+        threshold = self.config.paste_threshold
+        if threshold and len(text) > threshold:
+            self._paste_text(text)
+        else:
+            self._type_fn(text)
+
+    def _paste_text(self, text: str) -> None:
+        """Paste text through the clipboard, then restore the clipboard.
+
+        Falls back to typing when no clipboard backend is available (e.g.
+        Linux without xclip, xsel or wl-clipboard).
+        """
+        # Only needed when paste_threshold is set, so imported on first use
+        import pyperclip  # noqa: PLC0415
+
+        try:
+            previous = pyperclip.paste()
+            pyperclip.copy(text)
+        except pyperclip.PyperclipException as e:
+            logger.warning("Clipboard unavailable, typing text instead: %s", e)
+            self._type_fn(text)
+            return
+        try:
+            pyautogui.hotkey(*self._paste_keys, interval=self.config.hotkey_interval)
+            # The action pause may be 0, so wait explicitly for the target
+            # application to read the clipboard before it is restored
+            time.sleep(_PASTE_SETTLE_DELAY)
+        finally:
+            pyperclip.copy(previous)
+
+    def _do_scroll(self, arg: str) -> None:
+        x, y, direction = self._parse_scroll(arg)
+        pyautogui.moveTo(x, y)
+        scroll_amount = (
+            self.config.scroll_amount
+            if direction == "up"
+            else -self.config.scroll_amount
+        )
+        pyautogui.scroll(scroll_amount)
+
+    def _do_finish(self, arg: str) -> None:
+        # Task completion or infeasible - reset handler state
+        self.reset()
+
+    def _do_wait(self, arg: str) -> None:
+        # Wait for a short period
+        time.sleep(self.config.wait_duration)
+
+    def _do_call_user(self, arg: str) -> None:
+        # Call user - implementation depends on requirements
+        print("User intervention requested")
+
+    # Action type -> executor, looked up once per action instead of walking
+    # a match statement; built after the methods it references
+    _ACTION_EXECUTORS: ClassVar[dict[ActionType, Callable[..., None]]] = {
+        ActionType.CLICK: _do_click,
+        ActionType.LEFT_DOUBLE: _do_double_click,
+        ActionType.LEFT_TRIPLE: _do_triple_click,
+        ActionType.RIGHT_SINGLE: _do_right_click,
+        ActionType.DRAG: _do_drag,
+        ActionType.HOTKEY: _do_hotkey,
+        ActionType.TYPE: _do_type,
+        ActionType.SCROLL: _do_scroll,
+        ActionType.FINISH: _do_finish,
+        ActionType.FAIL: _do_finish,
+        ActionType.WAIT: _do_wait,
+        ActionType.CALL_USER: _do_call_user,
+    }
 
     def _execute_single_action(self, action: Action) -> None:
         """Execute a single action once."""
-        arg = action.argument or ""
-
-        match action.type:
-            case ActionType.CLICK:
-                x, y = self._parse_coords(arg)
-                self._move_and_wait(x, y)
-                pyautogui.click()
-
-            case ActionType.LEFT_DOUBLE:
-                x, y = self._parse_coords(arg)
-                self._move_and_wait(x, y)
-                if sys.platform == "darwin":
-                    _macos.macos_click(x, y, clicks=2)
-                else:
-                    pyautogui.doubleClick()
-
-            case ActionType.LEFT_TRIPLE:
-                x, y = self._parse_coords(arg)
-                self._move_and_wait(x, y)
-                if sys.platform == "darwin":
-                    _macos.macos_click(x, y, clicks=3)
-                else:
-                    pyautogui.tripleClick()
-
-            case ActionType.RIGHT_SINGLE:
-                x, y = self._parse_coords(arg)
-                self._move_and_wait(x, y)
-                pyautogui.rightClick()
-
-            case ActionType.DRAG:
-                x1, y1, x2, y2 = self._parse_drag_coords(arg)
-                pyautogui.moveTo(x1, y1)
-                pyautogui.dragTo(
-                    x2, y2, duration=self.config.drag_duration, button="left"
-                )
-
-            case ActionType.HOTKEY:
-                keys = self._parse_hotkey(arg)
-                # Check if this is a caps lock key press
-                if len(keys) == 1 and keys[0] == "capslock":
-                    if self.caps_manager.should_use_system_capslock():
-                        # System mode: use OS-level caps lock
-                        pyautogui.hotkey(
-                            "capslock", interval=self.config.hotkey_interval
-                        )
-                    else:
-                        # Session mode: toggle internal state
-                        self.caps_manager.toggle()
-                else:
-                    # Regular hotkey combination
-                    pyautogui.hotkey(*keys, interval=self.config.hotkey_interval)
-
-            case ActionType.TYPE:
-                text = arg
-                # Apply caps lock transformation if needed
-                text = self.caps_manager.transform_text(text)
-                # Use platform-specific typing that ignores system capslock
-                if sys.platform == "darwin":
-                    _macos.typewrite_exact(text)
-                elif sys.platform == "win32":
-                    _windows.typewrite_exact(text)
-                else:
-                    # Fallback for other platforms
-                    pyautogui.typewrite(text)
-
-            case ActionType.SCROLL:
-                x, y, direction = self._parse_scroll(arg)
-                pyautogui.moveTo(x, y)
-                scroll_amount = (
-                    self.config.scroll_amount
-                    if direction == "up"
-                    else -self.config.scroll_amount
-                )
-                pyautogui.scroll(scroll_amount)
-
-            case ActionType.FINISH | ActionType.FAIL:
-                # Task completion or infeasible - reset handler state
-                self.reset()
-
-            case ActionType.WAIT:
-                # Wait for a short period
-                time.sleep(self.config.wait_duration)
-
-            case ActionType.CALL_USER:
-                # Call user - implementation depends on requirements
-                print("User intervention requested")
-
-            case _:
-                print(f"Unknown action type: {action.type}")
+        executor = self._ACTION_EXECUTORS.get(action.type)
+        if executor is None:
+            logger.warning("Unknown action type: %s", action.type)
+            return
+        executor(self, action.argument or "")
 
     def _execute_action(self, action: Action) -> None:
         """Execute an action, potentially multiple times."""
@@ -231,13 +320,16 @@ class PyautoguiActionHandler:
 
     def __call__(self, actions: list[Action]) -> None:
         """Execute the provided list of actions."""
-        for action in actions:
+        for action in coalesce_type_actions(actions):
             try:
                 self._execute_action(action)
             except Exception as e:
-                print(f"Error executing action {action.type}: {e}")
+                logger.error("Error executing action %s: %s", action.type, e)
                 raise
 
         # Wait after batch for UI to settle before next screenshot
         if self.config.post_batch_delay > 0:
-            time.sleep(self.config.post_batch_delay)
+            if self.config.defer_post_batch_delay:
+                self._settle_until = time.monotonic() + self.config.post_batch_delay
+            else:
+                time.sleep(self.config.post_batch_delay)
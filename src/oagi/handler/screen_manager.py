@@ -7,6 +7,8 @@
 # -----------------------------------------------------------------------------
 
 
+import atexit
+import functools
 import sys
 from dataclasses import dataclass
 
@@ -16,7 +18,24 @@ from oagi.exceptions import check_optional_dependency
 _dpi_awareness_set = False
 
 
-@dataclass
+@functools.cache
+def _get_mss():
+    """Return a shared mss instance, created on first use (Windows only)."""
+    check_optional_dependency("mss", "ScreenManager", "desktop")
+    import mss  # noqa: PLC0415
+
+    return mss.mss()
+
+
+@atexit.register
+def _close_mss() -> None:
+    """Release the shared mss instance, if one was created."""
+    if _get_mss.cache_info().currsize:
+        _get_mss().close()
+        _get_mss.cache_clear()
+
+
+@dataclass(slots=True)
 class Screen:
     """
     Screen represents a single display screen.
@@ -49,7 +68,20 @@ class ScreenManager:
         if sys.platform == "win32":
             self.enable_windows_dpi_awareness()
 
+    def invalidate(self) -> None:
+        """Drop the cached screens so the next query re-detects them.
+
+        Call this after displays are connected, removed or rearranged.
+        """
+        self.screens = []
+        # mss caches monitor geometry per instance, so start a fresh one
+        _close_mss()
+
     def get_all_screens(self) -> list[Screen]:
+        """Return all screens, primary first, detecting them on first use.
+
+        Detection is cached on the instance until invalidate() is called.
+        """
         if self.screens:
             return self.screens
         if sys.platform == "darwin":
@@ -93,6 +125,8 @@ class ScreenManager:
         )
         # Retrieve screen information using AppKit
         screens = AppKit.NSScreen.screens()
+        # The primary screen is always first; read its height once
+        primary_height = int(screens[0].frame().size.height)
         screen_list = []
         for screen in screens:
             frame = screen.frame()
@@ -101,7 +135,7 @@ class ScreenManager:
             width, height = int(frame.size.width), int(frame.size.height)
             name = screen.localizedName()
             # Normalize the origin to Top-Left
-            y = int(AppKit.NSScreen.screens()[0].frame().size.height) - (y + height)
+            y = primary_height - (y + height)
             screen_list.append(Screen(name, x, y, width, height, x == 0 and y == 0))
         return screen_list
 
@@ -112,11 +146,8 @@ class ScreenManager:
         Returns:
             list[Screen]: A list of Screen objects representing all detected screens.
         """
-        check_optional_dependency("mss", "ScreenManager", "desktop")
-        import mss  # noqa: PLC0415
-
         screen_list = []
-        for index, screen in enumerate(mss.mss().monitors[1:]):
+        for index, screen in enumerate(_get_mss().monitors[1:]):
             screen_list.append(
                 Screen(
                     f"DISPLAY{index}",
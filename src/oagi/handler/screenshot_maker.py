@@ -6,7 +6,7 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
-from typing import Optional
+from typing import Any, Optional
 
 from oagi.handler.screen_manager import Screen
 
@@ -18,8 +18,16 @@ from .pil_image import PILImage
 class ScreenshotMaker:
     """Takes screenshots using pyautogui."""
 
-    def __init__(self, config: ImageConfig | None = None):
+    def __init__(self, config: ImageConfig | None = None, handler: Any = None):
+        """Initialize with optional image configuration.
+
+        Args:
+            config: ImageConfig instance for customizing screenshot format and quality
+            handler: Action handler whose deferred post-batch delay is waited
+                out before each capture (see ``defer_post_batch_delay``)
+        """
         self.config = config or ImageConfig()
+        self.handler = handler
         self._last_image: Optional[PILImage] = None
         self.region: Optional[tuple[int, int, int, int]] = None
 
@@ -29,6 +37,8 @@ class ScreenshotMaker:
 
     def __call__(self) -> Image:
         """Take and process a screenshot."""
+        self._wait_settle()
+
         # Create PILImage from screenshot
         pil_image = PILImage.from_screenshot(region=self.region)
 
@@ -41,6 +51,12 @@ class ScreenshotMaker:
 
         return pil_image
 
+    def _wait_settle(self) -> None:
+        """Let the UI finish settling after a batch that deferred its delay."""
+        wait_for_settle = getattr(self.handler, "wait_for_settle", None)
+        if callable(wait_for_settle):
+            wait_for_settle()
+
     def last_image(self) -> Image:
         """Return the last screenshot taken, or take a new one if none exists."""
         if self._last_image is None:
@@ -11,11 +11,28 @@ This module provides common functionality used by both PyautoguiActionHandler
 (for local execution) and action converters (for remote execution).
 """
 
+import asyncio
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
 
 from pydantic import BaseModel, Field
 
 from ..constants import DEFAULT_STEP_DELAY
+from ..exceptions import check_optional_dependency
+from ..types import Action, ActionType
+
+if check_optional_dependency(
+    "uvloop", "Fast event loop", "fast-loop", raise_error=False
+):
+    import uvloop
+else:
+    uvloop = None
+
+# Model outputs that chain several actions in one argument ("x and y")
+_CONJUNCTION_RE = re.compile(" (?:and|then) ", re.IGNORECASE)
 
 # =============================================================================
 # Key Normalization Mapping
@@ -231,6 +248,13 @@ PYAUTOGUI_VALID_KEYS: frozenset[str] = frozenset(
     }
 )
 
+# Normalized name for every spelling that needs no stripping or lowercasing:
+# each valid key maps to itself and each KEY_MAP variant to its target
+_NORMALIZED: dict[str, str] = {key: key for key in PYAUTOGUI_VALID_KEYS} | KEY_MAP
+
+# Sample of valid key names listed in invalid-hotkey errors
+_VALID_KEYS_SAMPLE = ", ".join(sorted(PYAUTOGUI_VALID_KEYS)[:30])
+
 
 # =============================================================================
 # Coordinate Scaling
@@ -269,6 +293,19 @@ class CoordinateScaler:
         self.origin_y = origin_y
         self.scale_x = target_width / source_width
         self.scale_y = target_height / source_height
+        # Rounding offsets for exact integer scaling of whole-number inputs
+        self._half_source_x = source_width // 2
+        self._half_source_y = source_height // 2
+        self._update_bounds()
+
+    def _update_bounds(self) -> None:
+        """Precompute the clamp bounds used by scale() for the target size."""
+        # (min, max) per axis for plain clamping and for fail-safe avoidance,
+        # which keeps coordinates 1 pixel away from every screen edge
+        self._clamp_x = (0, self.target_width - 1)
+        self._clamp_y = (0, self.target_height - 1)
+        self._failsafe_x = (1, self.target_width - 2)
+        self._failsafe_y = (1, self.target_height - 2)
 
     def scale(
         self,
@@ -309,24 +346,29 @@ class CoordinateScaler:
                     f"Coordinates must be normalized between 0 and {self.source_height}."
                 )
 
-        scaled_x = round(x * self.scale_x)
-        scaled_y = round(y * self.scale_y)
-
-        if clamp:
-            # Clamp to valid range
-            scaled_x = max(0, min(scaled_x, self.target_width - 1))
-            scaled_y = max(0, min(scaled_y, self.target_height - 1))
-
+        if x % 1 == 0 and y % 1 == 0:
+            # Model coordinates are whole numbers, parsed as int or float;
+            # scale them exactly in integer arithmetic, rounding halves up,
+            # so 750 and 750.0 always land on the same pixel
+            scaled_x = (
+                int(x) * self.target_width + self._half_source_x
+            ) // self.source_width
+            scaled_y = (
+                int(y) * self.target_height + self._half_source_y
+            ) // self.source_height
+        else:
+            scaled_x = round(x * self.scale_x)
+            scaled_y = round(y * self.scale_y)
+
+        # Fail-safe bounds lie within the clamp bounds, so one pass covers both
         if prevent_failsafe:
-            # Prevent PyAutoGUI fail-safe by adjusting corner coordinates
-            if scaled_x < 1:
-                scaled_x = 1
-            elif scaled_x > self.target_width - 2:
-                scaled_x = self.target_width - 2
-            if scaled_y < 1:
-                scaled_y = 1
-            elif scaled_y > self.target_height - 2:
-                scaled_y = self.target_height - 2
+            (min_x, max_x), (min_y, max_y) = self._failsafe_x, self._failsafe_y
+        elif clamp:
+            (min_x, max_x), (min_y, max_y) = self._clamp_x, self._clamp_y
+        else:
+            return scaled_x + self.origin_x, scaled_y + self.origin_y
+        scaled_x = max(min_x, min(scaled_x, max_x))
+        scaled_y = max(min_y, min(scaled_y, max_y))
 
         # Add origin offset (for multi-monitor support)
         return scaled_x + self.origin_x, scaled_y + self.origin_y
@@ -342,6 +384,7 @@ class CoordinateScaler:
         self.target_height = height
         self.scale_x = width / self.source_width
         self.scale_y = height / self.source_height
+        self._update_bounds()
 
 
 # =============================================================================
@@ -359,8 +402,12 @@ def normalize_key(key: str, *, macos_ctrl_to_cmd: bool = False) -> str:
     Returns:
         Normalized key name (e.g., "ctrl", "pagedown")
     """
-    key = key.strip().lower()
-    normalized = KEY_MAP.get(key, key)
+    # Model output is usually already lowercase and trimmed
+    normalized = _NORMALIZED.get(key)
+    if normalized is None:
+        key = key.strip().lower()
+        # Known names resolve to the shared canonical string object
+        normalized = _NORMALIZED.get(key, key)
 
     # Remap ctrl to command on macOS if enabled
     if macos_ctrl_to_cmd and sys.platform == "darwin" and normalized == "ctrl":
@@ -388,28 +435,32 @@ def parse_hotkey(
     Raises:
         ValueError: If validate=True and any key is invalid
     """
+    # Resolve the platform here so cached results stay correct per platform
+    keys = list(
+        _split_hotkey(hotkey_str, macos_ctrl_to_cmd and sys.platform == "darwin")
+    )
+
+    if validate:
+        validate_keys(keys)
+
+    return keys
+
+
+@lru_cache(maxsize=256)
+def _split_hotkey(hotkey_str: str, macos_ctrl_to_cmd: bool) -> tuple[str, ...]:
+    """Split and normalize a hotkey string; cached since agents repeat hotkeys."""
     # Remove parentheses if present
     hotkey_str = hotkey_str.strip("()")
 
     # Split by '+' or ',' to get individual keys
-    if "+" in hotkey_str:
-        keys = [
-            normalize_key(k, macos_ctrl_to_cmd=macos_ctrl_to_cmd)
-            for k in hotkey_str.split("+")
-        ]
-    else:
-        keys = [
-            normalize_key(k, macos_ctrl_to_cmd=macos_ctrl_to_cmd)
-            for k in hotkey_str.split(",")
-        ]
+    separator = "+" if "+" in hotkey_str else ","
+    keys = (
+        normalize_key(k, macos_ctrl_to_cmd=macos_ctrl_to_cmd)
+        for k in hotkey_str.split(separator)
+    )
 
     # Filter empty strings
-    keys = [k for k in keys if k]
-
-    if validate:
-        validate_keys(keys)
-
-    return keys
+    return tuple(k for k in keys if k)
 
 
 def validate_keys(keys: list[str]) -> None:
@@ -421,6 +472,11 @@ def validate_keys(keys: list[str]) -> None:
     Raises:
         ValueError: If any key is invalid, with helpful suggestions
     """
+    # Common case: every key is valid, checked in one C-level pass
+    if PYAUTOGUI_VALID_KEYS.issuperset(filter(None, keys)):
+        return
+
+    # Collect in order so the error lists keys as they appeared
     invalid_keys = [k for k in keys if k and k not in PYAUTOGUI_VALID_KEYS]
 
     if invalid_keys:
@@ -436,8 +492,7 @@ def validate_keys(keys: list[str]) -> None:
                 suggestions.append(f"'{invalid_key}' is not a valid key name")
 
         error_msg = "Invalid key name(s) in hotkey: " + ", ".join(suggestions)
-        valid_sample = ", ".join(sorted(list(PYAUTOGUI_VALID_KEYS)[:30]))
-        error_msg += f"\n\nValid keys include: {valid_sample}... (and more)"
+        error_msg += f"\n\nValid keys include: {_VALID_KEYS_SAMPLE}... (and more)"
         raise ValueError(error_msg)
 
 
@@ -468,7 +523,7 @@ def parse_click_coords(
         ValueError: If coordinate format is invalid or (strict=True) out of range
     """
     # Check for common format errors
-    if " and " in argument.lower() or " then " in argument.lower():
+    if _CONJUNCTION_RE.search(argument):
         raise ValueError(
             f"Invalid click format: '{argument}'. "
             "Cannot combine multiple actions with 'and' or 'then'."
@@ -482,8 +537,8 @@ def parse_click_coords(
         )
 
     try:
-        x = float(parts[0].strip())
-        y = float(parts[1].strip())
+        x = float(parts[0])
+        y = float(parts[1])
         return scaler.scale(x, y, prevent_failsafe=prevent_failsafe, strict=strict)
     except (ValueError, IndexError) as e:
         raise ValueError(
@@ -514,7 +569,7 @@ def parse_drag_coords(
         ValueError: If coordinate format is invalid or (strict=True) out of range
     """
     # Check for common format errors
-    if " and " in argument.lower() or " then " in argument.lower():
+    if _CONJUNCTION_RE.search(argument):
         raise ValueError(
             f"Invalid drag format: '{argument}'. "
             "Cannot combine multiple actions with 'and' or 'then'."
@@ -528,10 +583,10 @@ def parse_drag_coords(
         )
 
     try:
-        sx = float(parts[0].strip())
-        sy = float(parts[1].strip())
-        ex = float(parts[2].strip())
-        ey = float(parts[3].strip())
+        sx = float(parts[0])
+        sy = float(parts[1])
+        ex = float(parts[2])
+        ey = float(parts[3])
         x1, y1 = scaler.scale(sx, sy, prevent_failsafe=prevent_failsafe, strict=strict)
         x2, y2 = scaler.scale(ex, ey, prevent_failsafe=prevent_failsafe, strict=strict)
         return x1, y1, x2, y2
@@ -563,7 +618,7 @@ def parse_scroll_coords(
     Raises:
         ValueError: If format is invalid or (strict=True) coordinates out of range
     """
-    parts = [p.strip() for p in argument.split(",")]
+    parts = argument.split(",")
     if len(parts) != 3:
         raise ValueError(
             f"Invalid scroll format: '{argument}'. "
@@ -571,9 +626,11 @@ def parse_scroll_coords(
         )
 
     try:
+        # float() accepts surrounding whitespace, so only the direction
+        # needs stripping
         x = float(parts[0])
         y = float(parts[1])
-        direction = parts[2].lower()
+        direction = parts[2].strip().lower()
 
         if direction not in ("up", "down"):
             raise ValueError(
@@ -597,6 +654,27 @@ def parse_scroll_coords(
 # Handler Utility Functions
 # =============================================================================
 
+# GUI input and screen capture happen one at a time, so the async handlers and
+# screenshot maker share a single worker thread instead of the event loop's
+# default pool (which would otherwise grow up to min(32, cpu_count + 4) threads)
+ACTION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="oagi-gui")
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for event loops created after this call, if installed.
+
+    The async handlers schedule many short callbacks per step, where uvloop's
+    per-iteration overhead is noticeably lower than the default asyncio loop.
+    Call this before ``asyncio.run()``; the sync handlers are unaffected.
+
+    Returns:
+        True if the uvloop policy was installed, False if uvloop is unavailable.
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 def reset_handler(handler) -> None:
     """Reset handler state if supported.
@@ -608,8 +686,37 @@ def reset_handler(handler) -> None:
     Args:
         handler: The action handler to reset
     """
-    if hasattr(handler, "reset"):
-        handler.reset()
+    reset = getattr(handler, "reset", None)
+    if callable(reset):
+        reset()
+
+
+def coalesce_type_actions(actions: list[Action]) -> list[Action]:
+    """Merge runs of consecutive TYPE actions into a single TYPE action.
+
+    Typing the joined text produces the same keystrokes while paying the
+    per-call overhead (action pause, subprocess spawn) once per run instead of
+    once per action. Repeated actions are expanded into the joined text.
+
+    Args:
+        actions: Actions in execution order
+
+    Returns:
+        Actions with each run of TYPE actions replaced by one TYPE action
+    """
+    merged: list[Action] = []
+    for is_type, group in groupby(actions, key=_is_type_action):
+        run = list(group)
+        if not is_type or len(run) == 1:
+            merged.extend(run)
+            continue
+        text = "".join((action.argument or "") * (action.count or 1) for action in run)
+        merged.append(Action(type=ActionType.TYPE, argument=text, count=1))
+    return merged
+
+
+def _is_type_action(action: Action) -> bool:
+    return action.type is ActionType.TYPE
 
 
 def configure_handler_delay(handler, step_delay: float) -> None:
@@ -658,9 +765,16 @@ class PyautoguiConfig(BaseModel):
         default=True,
         description="Replace 'ctrl' with 'command' in hotkey combinations on macOS",
     )
+    paste_threshold: int = Field(
+        default=0,
+        ge=0,
+        description="Paste text longer than this many characters through the "
+        "clipboard instead of typing it key by key (0 disables pasting)",
+    )
     click_pre_delay: float = Field(
         default=0.1,
-        description="Delay in seconds after moving to position before clicking",
+        description="Delay in seconds after moving to position before clicking "
+        "(includes the action_pause that follows the move)",
     )
     post_batch_delay: float = Field(
         default=DEFAULT_STEP_DELAY,
@@ -668,6 +782,12 @@ class PyautoguiConfig(BaseModel):
         description="Delay after executing all actions in a batch (seconds). "
         "Allows UI to settle before next screenshot.",
     )
+    defer_post_batch_delay: bool = Field(
+        default=False,
+        description="If True, return right after a batch and have the next "
+        "capture of a ScreenshotMaker paired with this handler wait out the "
+        "rest of post_batch_delay instead.",
+    )
     sandbox_width: int = Field(
         default=1920, description="Target sandbox screen width in pixels"
     )
@@ -696,7 +816,6 @@ def make_type_command(text: str) -> str:
     """
     if not text:
         raise ValueError("Empty text for type command — invalid model output")
-    has_unicode = any(ord(c) > 127 for c in text)
-    if not has_unicode and "\n" not in text and len(text) <= _PYNPUT_CHAR_LIMIT:
+    if text.isascii() and "\n" not in text and len(text) <= _PYNPUT_CHAR_LIMIT:
         return f"PynputController().type({text!r})"
     return f"_smart_paste({text!r})"
@@ -32,12 +32,13 @@ def is_wayland_display_server() -> bool:
 
 def get_screen_size() -> tuple[int, int]:
     """Get the screen size in pixels."""
-    for monitor in get_monitors():
+    # Enumerate once; each get_monitors() call re-queries the display server
+    monitors = get_monitors()
+    for monitor in monitors:
         if monitor.is_primary:
             return monitor.width, monitor.height
 
     # Fallback if no monitor is marked primary
-    monitors = get_monitors()
     if monitors:
         return monitors[0].width, monitors[0].height
     raise Exception("No monitor found, cannot get the screen size info")
@@ -119,17 +120,13 @@ class Ydotool:
                 + "Please disable mouse acceleration by running 'gsettings set org.gnome.desktop.peripherals.mouse accel-profile 'flat''",
             )
 
-    def _get_keycode(self, key_char: str) -> int:
+    def _get_keycode(self, key_char: str) -> int | None:
         """
         Get the keycode from input-event-codes mapping.
         :param key_char: Key char (e.g., "A", "ENTER", "F1", "PRINT_SCREEN", case-insensitive)
-        :return: Decimal keycode
+        :return: Decimal keycode, or None for unmapped keys
         """
-        # Lookup and return keycode
-        if key_char in KEYCODE_MAP:
-            return KEYCODE_MAP[key_char]
-        else:
-            return None
+        return KEYCODE_MAP.get(key_char)
 
     def _run_ydotool(self, args: list[str], count: int = 1) -> None:
         """
@@ -214,8 +211,9 @@ class Ydotool:
         """
         Press and release the given keys.
         """
+        # Resolve each key once; unmapped keys are skipped
         hotkey_sequences = [
-            self._get_keycode(key) for key in keys if self._get_keycode(key) is not None
+            keycode for keycode in map(self._get_keycode, keys) if keycode is not None
         ]
         command_args = [f"{keycode}:1" for keycode in hotkey_sequences] + [
             f"{keycode}:0" for keycode in hotkey_sequences[::-1]
@@ -6,6 +6,7 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import logging
 import time
 
 from pydantic import BaseModel, Field
@@ -15,9 +16,16 @@ from oagi.handler.screen_manager import Screen
 from ..constants import DEFAULT_STEP_DELAY
 from ..types import Action, ActionType, parse_coords, parse_drag_coords, parse_scroll
 from .capslock_manager import CapsLockManager
-from .utils import CoordinateScaler, normalize_key, parse_hotkey
+from .utils import (
+    CoordinateScaler,
+    coalesce_type_actions,
+    normalize_key,
+    parse_hotkey,
+)
 from .wayland_support import Ydotool, get_screen_size
 
+logger = logging.getLogger(__name__)
+
 
 class YdotoolConfig(BaseModel):
     """Configuration for YdotoolActionHandler."""
@@ -46,6 +54,12 @@ class YdotoolConfig(BaseModel):
         description="Delay after executing all actions in a batch (seconds). "
         "Allows UI to settle before next screenshot.",
     )
+    defer_post_batch_delay: bool = Field(
+        default=False,
+        description="If True, return right after a batch and have the next "
+        "capture of a ScreenshotMaker paired with this handler wait out the "
+        "rest of post_batch_delay instead.",
+    )
 
 
 class YdotoolActionHandler(Ydotool):
@@ -72,6 +86,9 @@ class YdotoolActionHandler(Ydotool):
         self.action_pause = self.config.action_pause
         # Initialize caps lock manager
         self.caps_manager = CapsLockManager(mode=self.config.capslock_mode)
+        # Monotonic time until which the UI may still be settling after a batch
+        # whose post_batch_delay was deferred to the next screenshot
+        self._settle_until = 0.0
         # The origin position of coordinates (the top-left corner of the screen)
         self.origin_x, self.origin_y = 0, 0
         # Initialize coordinate scaler
@@ -90,6 +107,15 @@ class YdotoolActionHandler(Ydotool):
         """
         self.caps_manager.reset()
 
+    def wait_for_settle(self) -> None:
+        """Sleep for whatever remains of a deferred post-batch delay.
+
+        Called by a ScreenshotMaker paired with this handler before capturing.
+        """
+        remaining = self._settle_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
     def set_target_screen(self, screen: Screen) -> None:
         """Set the target screen for the action handler.
 
@@ -98,20 +124,15 @@ class YdotoolActionHandler(Ydotool):
         """
         self.screen_width, self.screen_height = screen.width, screen.height
         self.origin_x, self.origin_y = screen.x, screen.y
-        self._coord_scaler = CoordinateScaler(
-            source_width=1000,
-            source_height=1000,
-            target_width=self.screen_width,
-            target_height=self.screen_height,
-        )
+        self._coord_scaler.set_target_size(screen.width, screen.height)
 
     def _execute_action(self, action: Action) -> bool:
         """
         Execute a group of actions and return whether FINISH is reached.
         """
         finished = False
-        raw_arg = action.argument or ""
-        arg = raw_arg if action.type == ActionType.TYPE else raw_arg.strip()
+        # TYPE text is used verbatim; the parsers strip their own input
+        arg = action.argument or ""
         count = int(action.count or 1)
 
         match action.type:
@@ -177,7 +198,7 @@ class YdotoolActionHandler(Ydotool):
                 print("User intervention requested")
 
             case _:
-                print(f"Unknown action type: {action.type}")
+                logger.warning("Unknown action type: %s", action.type)
 
         return finished
 
@@ -193,14 +214,14 @@ class YdotoolActionHandler(Ydotool):
 
     def _parse_coords(self, args_str: str) -> tuple[int, int]:
         """Extract x, y coordinates from argument string."""
-        coords = parse_coords(args_str)
+        coords = parse_coords(args_str.strip())
         if not coords:
             raise ValueError(f"Invalid coordinates format: {args_str}")
         return self._denormalize_coords(coords[0], coords[1])
 
     def _parse_drag_coords(self, args_str: str) -> tuple[int, int, int, int]:
         """Extract x1, y1, x2, y2 coordinates from drag argument string."""
-        coords = parse_drag_coords(args_str)
+        coords = parse_drag_coords(args_str.strip())
         if not coords:
             raise ValueError(f"Invalid drag coordinates format: {args_str}")
         x1, y1 = self._denormalize_coords(coords[0], coords[1])
@@ -209,7 +230,7 @@ class YdotoolActionHandler(Ydotool):
 
     def _parse_scroll(self, args_str: str) -> tuple[int, int, str]:
         """Extract x, y, direction from scroll argument string."""
-        result = parse_scroll(args_str)
+        result = parse_scroll(args_str.strip())
         if not result:
             raise ValueError(f"Invalid scroll format: {args_str}")
         x, y = self._denormalize_coords(result[0], result[1])
@@ -217,17 +238,20 @@ class YdotoolActionHandler(Ydotool):
 
     def _parse_hotkey(self, args_str: str) -> list[str]:
         """Parse hotkey string into list of keys."""
-        return parse_hotkey(args_str.strip("()"), validate=False)
+        return parse_hotkey(args_str.strip().strip("()"), validate=False)
 
     def __call__(self, actions: list[Action]) -> None:
         """Execute the provided list of actions."""
-        for action in actions:
+        for action in coalesce_type_actions(actions):
             try:
                 self._execute_action(action)
             except Exception as e:
-                print(f"Error executing action {action.type}: {e}")
+                logger.error("Error executing action %s: %s", action.type, e)
                 raise
 
         # Wait after batch for UI to settle before next screenshot
         if self.config.post_batch_delay > 0:
-            time.sleep(self.config.post_batch_delay)
+            if self.config.defer_post_batch_delay:
+                self._settle_until = time.monotonic() + self.config.post_batch_delay
+            else:
+                time.sleep(self.config.post_batch_delay)
@@ -11,6 +11,11 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
+# Argument patterns, compiled once instead of looked up in re's cache per call
+_COORDS_RE = re.compile(r"(\d+),\s*(\d+)")
+_DRAG_COORDS_RE = re.compile(r"(\d+),\s*(\d+),\s*(\d+),\s*(\d+)")
+_SCROLL_RE = re.compile(r"(\d+),\s*(\d+),\s*(\w+)")
+
 
 class ActionType(str, Enum):
     CLICK = "click"
@@ -44,7 +49,7 @@ def parse_coords(args_str: str) -> tuple[int, int] | None:
     Returns:
         Tuple of (x, y) coordinates, or None if parsing fails
     """
-    match = re.match(r"(\d+),\s*(\d+)", args_str)
+    match = _COORDS_RE.match(args_str)
     if not match:
         return None
     return int(match.group(1)), int(match.group(2))
@@ -59,15 +64,11 @@ def parse_drag_coords(args_str: str) -> tuple[int, int, int, int] | None:
     Returns:
         Tuple of (x1, y1, x2, y2) coordinates, or None if parsing fails
     """
-    match = re.match(r"(\d+),\s*(\d+),\s*(\d+),\s*(\d+)", args_str)
+    match = _DRAG_COORDS_RE.match(args_str)
     if not match:
         return None
-    return (
-        int(match.group(1)),
-        int(match.group(2)),
-        int(match.group(3)),
-        int(match.group(4)),
-    )
+    x1, y1, x2, y2 = map(int, match.groups())
+    return x1, y1, x2, y2
 
 
 def parse_scroll(args_str: str) -> tuple[int, int, str] | None:
@@ -79,7 +80,7 @@ def parse_scroll(args_str: str) -> tuple[int, int, str] | None:
     Returns:
         Tuple of (x, y, direction) where direction is "up" or "down", or None if parsing fails
     """
-    match = re.match(r"(\d+),\s*(\d+),\s*(\w+)", args_str)
+    match = _SCROLL_RE.match(args_str)
     if not match:
         return None
     direction = match.group(3).lower()
@@ -11,6 +11,10 @@ import re
 from ..types.models.action import Action, ActionType
 from ..types.models.step import Step
 
+# Action names as emitted by the model -> ActionType, so the common lowercase
+# case needs neither a str.lower() copy nor an Enum value lookup
+_ACTION_TYPES: dict[str, ActionType] = {t.value: t for t in ActionType}
+
 
 def parse_raw_output(raw_output: str) -> Step:
     """Parse raw LLM output into structured Step format.
@@ -119,23 +123,24 @@ def _parse_action(action_text: str) -> Action | None:
     if not match:
         return None
 
-    action_type = match.group(1).lower()
+    # Validate and map action type to enum
+    action_name = match.group(1)
+    action_enum = _ACTION_TYPES.get(action_name) or _ACTION_TYPES.get(
+        action_name.lower()
+    )
+    if action_enum is None:
+        return None
+
     # Don't strip TYPE arguments — spaces, tabs etc. are valid content
     # (e.g. type( ) means "type a space"). Other action types are safe to strip.
     raw_arguments = match.group(2)
     arguments = (
-        raw_arguments if action_type == ActionType.TYPE.value else raw_arguments.strip()
+        raw_arguments if action_enum is ActionType.TYPE else raw_arguments.strip()
     )
 
     # Parse count from arguments for actions that support it
     count = 1
 
-    # Validate and map action type to enum
-    try:
-        action_enum = ActionType(action_type)
-    except ValueError:
-        return None
-
     # Parse specific action types and extract count where applicable
     match action_enum:
         case ActionType.HOTKEY:
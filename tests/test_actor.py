@@ -6,6 +6,7 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import time
 from unittest.mock import patch
 
 import pytest
@@ -415,6 +416,47 @@ class TestActorHistory:
         assert actor.message_history[2]["role"] == "user"
         assert actor.message_history[3]["role"] == "assistant"
 
+    def test_step_reuses_upload_for_identical_screenshot(
+        self, actor, sample_step, sample_usage_obj
+    ):
+        """Test that an identical screenshot is uploaded only once."""
+        actor.task_description = "Test task"
+        actor.client.put_s3_presigned_url.return_value = UploadFileResponse(
+            url="https://s3.amazonaws.com/presigned-url",
+            uuid="test-uuid-123",
+            expires_at=int(time.time()) + 600,
+            file_expires_at=int(time.time()) + 3600,
+            download_url="https://cdn.example.com/test-uuid-123",
+        )
+        actor.client.chat_completion.return_value = (
+            sample_step,
+            "raw output",
+            sample_usage_obj,
+        )
+
+        actor.step(b"screenshot")
+        actor.step(b"screenshot")
+        actor.step(b"other screenshot")
+
+        assert actor.client.put_s3_presigned_url.call_count == 2
+        assert "test-uuid-123" in str(actor.message_history[2])
+
+    def test_step_failure_leaves_history_unchanged(
+        self, actor, mock_upload_file_response
+    ):
+        """Test that a failed request does not leave a dangling user message."""
+        actor.task_description = "Test task"
+        actor.client.put_s3_presigned_url.return_value = mock_upload_file_response
+        actor.client.chat_completion.side_effect = Exception("API Error")
+
+        with pytest.raises(Exception, match="API Error"):
+            actor.step(b"screenshot")
+
+        assert actor.message_history == []
+        sent = actor.client.chat_completion.call_args.kwargs["messages"]
+        assert len(sent) == 1
+        assert sent[0]["role"] == "user"
+
     def test_step_only_appends_assistant_when_raw_output_exists(
         self, actor, sample_step, sample_usage_obj, mock_upload_file_response
     ):
@@ -119,7 +119,9 @@ class TestAsyncActorStep:
             return_value=(sample_step, "raw output", sample_usage_obj)
         )
         async_actor.client.put_s3_presigned_url = AsyncMock(
-            return_value=AsyncMock(download_url="https://cdn.example.com/image.png")
+            return_value=AsyncMock(
+                download_url="https://cdn.example.com/image.png", file_expires_at=0
+            )
         )
         await async_actor.init_task("Test task", max_steps=3)
 
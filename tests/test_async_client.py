@@ -6,6 +6,7 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import asyncio
 import os
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -262,6 +263,49 @@ class TestAsyncClientS3Upload:
         assert result.download_url == upload_file_response["download_url"]
 
 
+class TestAsyncClientWorkerBatch:
+    @pytest.mark.asyncio
+    async def test_call_workers_batch_preserves_order(self, test_client):
+        async def fake_call_worker(**kwargs):
+            await asyncio.sleep(0.01 if kwargs["overall_todo"] == "first" else 0)
+            return kwargs["overall_todo"]
+
+        test_client.call_worker = AsyncMock(side_effect=fake_call_worker)
+        requests = [
+            {"worker_id": "oagi_first", "overall_todo": todo}
+            for todo in ("first", "second", "third")
+        ]
+
+        results = await test_client.call_workers_batch(requests)
+
+        assert results == ["first", "second", "third"]
+        assert test_client.call_worker.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_call_workers_batch_limits_concurrency(self, test_client):
+        in_flight = 0
+        peak = 0
+
+        async def fake_call_worker(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        test_client.call_worker = AsyncMock(side_effect=fake_call_worker)
+        requests = [{"worker_id": "oagi_first"} for _ in range(6)]
+
+        await test_client.call_workers_batch(requests, concurrency=2)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_call_workers_batch_rejects_invalid_concurrency(self, test_client):
+        with pytest.raises(ValueError, match="concurrency"):
+            await test_client.call_workers_batch([], concurrency=0)
+
+
 class TestAsyncClientContextManager:
     @pytest.mark.asyncio
     async def test_context_manager(self, api_env):
@@ -15,6 +15,7 @@ from oagi import ImageConfig, PyautoguiConfig
 from oagi.handler.async_pyautogui_action_handler import AsyncPyautoguiActionHandler
 from oagi.handler.async_screenshot_maker import AsyncScreenshotMaker
 from oagi.handler.pil_image import PILImage
+from oagi.handler.utils import ACTION_EXECUTOR
 from oagi.types import Action, ActionType
 
 
@@ -70,14 +71,14 @@ class TestAsyncPyautoguiActionHandler:
     async def test_execute_actions_with_thread_pool(self, mock_actions):
         handler = AsyncPyautoguiActionHandler()
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             mock_loop.run_in_executor = AsyncMock()
             mock_get_loop.return_value = mock_loop
 
             await handler(mock_actions)
             mock_loop.run_in_executor.assert_called_once_with(
-                None, handler.sync_handler, mock_actions
+                ACTION_EXECUTOR, handler.sync_handler, mock_actions
             )
 
     @pytest.mark.asyncio
@@ -89,7 +90,7 @@ class TestAsyncPyautoguiActionHandler:
             await asyncio.sleep(0.01)
             return "completed"
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             mock_loop.run_in_executor = AsyncMock()
             mock_get_loop.return_value = mock_loop
@@ -99,7 +100,7 @@ class TestAsyncPyautoguiActionHandler:
                 other_task(),
             )
             mock_loop.run_in_executor.assert_called_once_with(
-                None, handler.sync_handler, actions
+                ACTION_EXECUTOR, handler.sync_handler, actions
             )
             assert results[1] == "completed"
 
@@ -121,14 +122,14 @@ class TestAsyncScreenshotMaker:
     async def test_capture_screenshot_with_thread_pool(self, mock_image):
         maker = AsyncScreenshotMaker()
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             mock_loop.run_in_executor = AsyncMock(return_value=mock_image)
             mock_get_loop.return_value = mock_loop
 
             result = await maker()
             mock_loop.run_in_executor.assert_called_once_with(
-                None, maker.sync_screenshot_maker
+                ACTION_EXECUTOR, maker.sync_screenshot_maker
             )
             assert result == mock_image
 
@@ -140,7 +141,7 @@ class TestAsyncScreenshotMaker:
         mock_image1 = Mock(spec=PILImage, id=1)
         mock_image2 = Mock(spec=PILImage, id=2)
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             # Set up different return values for each call
             mock_loop.run_in_executor.side_effect = [mock_image1, mock_image2]
@@ -166,7 +167,7 @@ class TestAsyncHandlerIntegration:
 
         actions = [Action(type=ActionType.SCROLL, argument="500, 300, up", count=1)]
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             mock_loop.run_in_executor = AsyncMock(side_effect=[mock_image, None])
             mock_get_loop.return_value = mock_loop
@@ -175,9 +176,11 @@ class TestAsyncHandlerIntegration:
             await handler(actions)
 
             assert mock_loop.run_in_executor.call_count == 2
-            mock_loop.run_in_executor.assert_any_call(None, maker.sync_screenshot_maker)
             mock_loop.run_in_executor.assert_any_call(
-                None, handler.sync_handler, actions
+                ACTION_EXECUTOR, maker.sync_screenshot_maker
+            )
+            mock_loop.run_in_executor.assert_any_call(
+                ACTION_EXECUTOR, handler.sync_handler, actions
             )
             assert screenshot == mock_image
 
@@ -186,7 +189,7 @@ class TestAsyncHandlerIntegration:
         handler = AsyncPyautoguiActionHandler()
         actions = [Action(type=ActionType.CLICK, argument="invalid", count=1)]
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             mock_loop.run_in_executor = AsyncMock(
                 side_effect=ValueError("Invalid coordinates")
@@ -202,7 +205,7 @@ class TestAsyncHandlerIntegration:
         handler1 = AsyncPyautoguiActionHandler()
         handler2 = AsyncPyautoguiActionHandler()
 
-        with patch("asyncio.get_event_loop") as mock_get_loop:
+        with patch("asyncio.get_running_loop") as mock_get_loop:
             mock_loop = AsyncMock()
             mock_loop.run_in_executor = AsyncMock()
             mock_get_loop.return_value = mock_loop
@@ -215,8 +218,8 @@ class TestAsyncHandlerIntegration:
             assert mock_loop.run_in_executor.call_count == 2
             # Verify each handler called with its own sync_handler instance
             mock_loop.run_in_executor.assert_any_call(
-                None, handler1.sync_handler, mock_actions
+                ACTION_EXECUTOR, handler1.sync_handler, mock_actions
             )
             mock_loop.run_in_executor.assert_any_call(
-                None, handler2.sync_handler, mock_actions
+                ACTION_EXECUTOR, handler2.sync_handler, mock_actions
             )
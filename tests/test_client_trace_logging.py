@@ -0,0 +1,69 @@
+# -----------------------------------------------------------------------------
+#  Copyright (c) OpenAGI Foundation
+#  All rights reserved.
+#
+#  This file is part of the official API project.
+#  Licensed under the MIT License.
+# -----------------------------------------------------------------------------
+
+import inspect
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from oagi.client import AsyncClient, SyncClient
+from oagi.exceptions import ServerError
+
+
+def _failing_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        500,
+        json={"error": {"code": "internal", "message": "boom"}},
+        headers={"x-request-id": "req-123", "x-trace-id": "trace-456"},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "client_cls,openai_path,transport_path",
+    [
+        (SyncClient, "oagi.client.sync.OpenAI", "oagi.client.sync.HTTPTransport"),
+        (
+            AsyncClient,
+            "oagi.client.async_.AsyncOpenAI",
+            "oagi.client.async_.AsyncHTTPTransport",
+        ),
+    ],
+)
+async def test_call_worker_failure_logs_trace_ids(
+    api_env, client_cls, openai_path, transport_path
+):
+    """Both clients log trace IDs captured by their response hook."""
+    with (
+        patch(openai_path),
+        patch(transport_path, return_value=httpx.MockTransport(_failing_handler)),
+    ):
+        client = client_cls(base_url=api_env["base_url"], api_key=api_env["api_key"])
+
+    with patch("oagi.client.base.logger") as mock_logger:
+        with pytest.raises(ServerError):
+            result = client.call_worker(
+                worker_id="oagi_first",
+                overall_todo="todo",
+                task_description="task",
+                todos=[],
+            )
+            if inspect.isawaitable(result):
+                await result
+
+    logged = [call.args[0] for call in mock_logger.error.call_args_list]
+    assert "Request Id: req-123" in logged
+    assert "Trace Id: trace-456" in logged
+
+    if isinstance(client, AsyncClient):
+        await client.http_client.aclose()
+        await client.upload_client.aclose()
+    else:
+        client.http_client.close()
+        client.upload_client.close()
@@ -80,29 +80,25 @@ def test_macos_click_implementation(mock_quartz):
 
 def test_handler_calls_macos_click_double(mock_pyautogui):
     """Test that handler calls macos_click for double click on macOS."""
-    handler = PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
     action = Action(type=ActionType.LEFT_DOUBLE, argument="500, 500", count=1)
 
-    with (
-        patch.object(sys, "platform", "darwin"),
-        patch("oagi.handler.pyautogui_action_handler._macos") as mock_macos_module,
-    ):
+    # The handler binds macos_click when constructed
+    with patch.object(_macos, "macos_click") as mock_macos_click:
+        handler = PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
         handler([action])
 
-        mock_macos_module.macos_click.assert_called_once_with(960, 540, clicks=2)
+        mock_macos_click.assert_called_once_with(960, 540, clicks=2)
         mock_pyautogui.doubleClick.assert_not_called()
 
 
 def test_handler_calls_macos_click_triple(mock_pyautogui):
     """Test that handler calls macos_click for triple click on macOS."""
-    handler = PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
     action = Action(type=ActionType.LEFT_TRIPLE, argument="500, 500", count=1)
 
-    with (
-        patch.object(sys, "platform", "darwin"),
-        patch("oagi.handler.pyautogui_action_handler._macos") as mock_macos_module,
-    ):
+    # The handler binds macos_click when constructed
+    with patch.object(_macos, "macos_click") as mock_macos_click:
+        handler = PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
         handler([action])
 
-        mock_macos_module.macos_click.assert_called_once_with(960, 540, clicks=3)
+        mock_macos_click.assert_called_once_with(960, 540, clicks=3)
         mock_pyautogui.tripleClick.assert_not_called()
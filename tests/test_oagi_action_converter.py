@@ -7,10 +7,16 @@
 # -----------------------------------------------------------------------------
 
 import logging
+from unittest.mock import Mock, patch
 
 import pytest
 
-from oagi.converters import OagiActionConverter, PyautoguiActionConvertor
+from oagi.converters import (
+    BaseActionConverter,
+    OagiActionConverter,
+    PyautoguiActionConvertor,
+)
+from oagi.handler.utils import PyautoguiConfig
 from oagi.types import Action, ActionType
 
 
@@ -74,6 +80,70 @@ class TestHotkeyAction:
         assert len(cmds) == 1
         assert "pyautogui.hotkey('ctrl', 'c', interval=0.1)" in cmds[0]
 
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("Page_Up", "pageup"),
+            ("pgdn", "pagedown"),
+            ("PrtSc", "printscreen"),
+            ("caps", "capslock"),
+            ("super", "win"),
+            ("cmd", "command"),
+            (" Control ", "ctrl"),
+            ("mute", "volumemute"),
+            ("enter", "enter"),
+        ],
+    )
+    def test_normalize_key_aliases(self, converter, key, expected):
+        assert converter._normalize_key(key) == expected
+
+    def test_repeated_hotkey_uses_cached_parse(self, converter):
+        action = Action(type=ActionType.HOTKEY, argument="Control+Page_Down", count=1)
+        first = converter([action])
+
+        with patch.object(converter, "_normalize_key") as mock_normalize:
+            second = converter([action])
+
+        mock_normalize.assert_not_called()
+        assert first == second
+        assert _cmds(second) == ["pyautogui.hotkey('ctrl', 'pagedown', interval=0.1)"]
+
+    def test_invalid_hotkey_is_not_cached(self, converter):
+        action = Action(type=ActionType.HOTKEY, argument="ctrl+bogus", count=1)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="Invalid key name"):
+                converter([action])
+        assert converter._hotkey_cache == {}
+
+    def test_invalid_key_error_includes_hint_and_sample(self, converter):
+        with pytest.raises(ValueError) as exc_info:
+            converter._validate_keys(["ctrl", "numpad1"])
+        message = str(exc_info.value)
+        assert "'numpad1' → numpad keys use format 'num0'-'num9'" in message
+        assert "Valid keys include: " in message
+
+    @pytest.mark.parametrize(
+        "argument,expected",
+        [
+            ("ctrl+\\", "pyautogui.hotkey('ctrl', '\\\\', interval=0.1)"),
+            ("ctrl+'", "pyautogui.hotkey('ctrl', \"'\", interval=0.1)"),
+        ],
+        ids=["backslash", "quote"],
+    )
+    def test_hotkey_escapes_special_keys(self, converter, argument, expected):
+        action = Action(type=ActionType.HOTKEY, argument=argument, count=1)
+        assert _cmds(converter([action])) == [expected]
+
+    def test_repeated_hotkey_reuses_command(self, converter):
+        action = Action(type=ActionType.HOTKEY, argument="alt+tab", count=1)
+        converter([action])
+
+        with patch.object(converter, "_parse_hotkey") as mock_parse:
+            result = converter([action])
+
+        mock_parse.assert_not_called()
+        assert _cmds(result) == ["pyautogui.hotkey('alt', 'tab', interval=0.1)"]
+
 
 class TestTypeAction:
     def test_short_ascii_uses_pynput(self, converter):
@@ -138,8 +208,8 @@ class TestTypeAction:
 class TestScrollAction:
     @pytest.mark.parametrize(
         "direction,expected_amount",
-        [("up", 2), ("down", -2)],
-        ids=["scroll-up", "scroll-down"],
+        [("up", 2), ("down", -2), ("Up", 2), ("DOWN", -2)],
+        ids=["scroll-up", "scroll-down", "scroll-up-mixed-case", "scroll-down-upper"],
     )
     def test_scroll_conversion(self, converter, direction, expected_amount):
         action = Action(
@@ -151,6 +221,11 @@ class TestScrollAction:
         assert "pyautogui.moveTo(960, 324)" in cmds[0]
         assert f"pyautogui.scroll({expected_amount})" in cmds[1]
 
+    def test_invalid_scroll_direction_raises(self, converter):
+        action = Action(type=ActionType.SCROLL, argument="500, 300, left", count=1)
+        with pytest.raises(RuntimeError, match="Invalid scroll direction: 'left'"):
+            converter([action])
+
 
 class TestSpecialActions:
     def test_wait_action(self, converter):
@@ -159,6 +234,15 @@ class TestSpecialActions:
         cmds = _cmds(result)
         assert "WAIT(1.0)" in cmds[0]
 
+    def test_wait_action_with_duration(self, converter):
+        action = Action(type=ActionType.WAIT, argument="2.5", count=1)
+        assert _cmds(converter([action])) == ["WAIT(2.5)"]
+
+    def test_wait_action_invalid_duration(self, converter):
+        action = Action(type=ActionType.WAIT, argument="soon", count=1)
+        with pytest.raises(RuntimeError, match="Invalid wait duration"):
+            converter([action])
+
     def test_finish_action(self, converter):
         action = Action(type=ActionType.FINISH, argument="", count=1)
         result = converter([action])
@@ -177,6 +261,17 @@ class TestSpecialActions:
         with pytest.raises(ValueError, match="Duplicate finish\\(\\)/fail\\(\\)"):
             converter(actions)
 
+    def test_action_missing_argument_is_reported(self):
+        logger = Mock()
+        converter = PyautoguiActionConvertor(logger=logger)
+        actions = [
+            Mock(spec=["type", "count"], type=ActionType.CLICK, count=1),
+            Action(type=ActionType.FINISH, argument="", count=1),
+        ]
+        result = converter(actions)
+        assert _cmds(result) == ["DONE"]
+        assert "missing required attribute" in logger.error.call_args.args[0]
+
 
 class TestActionStringToStep:
     def test_pyautogui_command(self, converter):
@@ -199,6 +294,13 @@ class TestActionStringToStep:
         assert step["type"] == "sleep"
         assert step["parameters"]["seconds"] == 5.0
 
+    def test_invalid_wait_command_falls_through_to_shell(self, converter):
+        step = converter.action_string_to_step("wait(-1)")
+        assert step == {
+            "type": "execute",
+            "parameters": {"command": "wait(-1)", "shell": True},
+        }
+
     def test_done_command(self, converter):
         step = converter.action_string_to_step("DONE")
         assert step["type"] == "sleep"
@@ -232,6 +334,15 @@ class TestMultipleActions:
         # is_last only on the very last command
         assert [is_last for _, is_last in result] == [False, False, False, True]
 
+    def test_repeated_action_parsed_once(self, converter):
+        action = Action(type=ActionType.SCROLL, argument="500, 300, down", count=5)
+        with patch.object(
+            converter, "_denormalize_coords", wraps=converter._denormalize_coords
+        ) as denorm:
+            result = converter([action])
+        assert len(result) == 10
+        denorm.assert_called_once()
+
 
 class TestCoordinateValidation:
     @pytest.mark.parametrize(
@@ -250,12 +361,63 @@ class TestCoordinateValidation:
         with pytest.raises(RuntimeError, match=match_pattern):
             converter([action])
 
+    @pytest.mark.parametrize(
+        "action_type,argument",
+        [
+            (ActionType.CLICK, "500, 300 and 200, 100"),
+            (ActionType.CLICK, "500, 300 THEN 200, 100"),
+            (ActionType.DRAG, "100, 100, 500, 300 Then 1, 1, 2, 2"),
+        ],
+        ids=["click-and", "click-then-upper", "drag-then"],
+    )
+    def test_rejects_chained_actions(self, converter, action_type, argument):
+        action = Action(type=action_type, argument=argument, count=1)
+        with pytest.raises(RuntimeError, match="Cannot combine multiple actions"):
+            converter([action])
+
     def test_boundary_1000_clamps_to_max(self, converter):
         """Coordinates at exactly 1000 are valid but clamped to screen edge."""
         action = Action(type=ActionType.CLICK, argument="1000, 1000", count=1)
         result = converter([action])
         assert result[0][0] == "pyautogui.click(x=1919, y=1079)"
 
+    def test_integer_and_fractional_coords_scale_alike(self, converter):
+        for value in range(0, 1001, 7):
+            assert converter._denormalize_coords(
+                value, value
+            ) == converter._denormalize_coords(float(value), float(value))
+
+    def test_whole_float_argument_rounds_like_integer(self):
+        converter = PyautoguiActionConvertor(
+            config=PyautoguiConfig(sandbox_width=1366), logger=logging.getLogger("test")
+        )
+        for argument in ("750, 0", "750.0, 0.0"):
+            action = Action(type=ActionType.CLICK, argument=argument, count=1)
+            assert converter([action])[0][0] == "pyautogui.click(x=1025, y=0)"
+
+    @pytest.mark.parametrize(
+        "argument,match_pattern",
+        [
+            ("500", "Invalid click coordinate format"),
+            ("", "Invalid click coordinate format"),
+            ("500, abc", "Failed to parse click coords"),
+        ],
+        ids=["single-value", "empty", "non-numeric"],
+    )
+    def test_rejects_malformed_click(self, converter, argument, match_pattern):
+        action = Action(type=ActionType.CLICK, argument=argument, count=1)
+        with pytest.raises(RuntimeError, match=match_pattern):
+            converter([action])
+
+    def test_click_ignores_extra_values(self, converter):
+        action = Action(type=ActionType.CLICK, argument="500, 300, 10", count=1)
+        assert _cmds(converter([action])) == ["pyautogui.click(x=960, y=324)"]
+
+    def test_fractional_coords(self, converter):
+        action = Action(type=ActionType.CLICK, argument="500.5, 299.6", count=1)
+        result = converter([action])
+        assert result[0][0] == "pyautogui.click(x=961, y=324)"
+
     @pytest.mark.parametrize(
         "action_type,argument",
         [
@@ -268,3 +430,151 @@ class TestCoordinateValidation:
         action = Action(type=action_type, argument=argument, count=1)
         with pytest.raises(RuntimeError, match="x coordinate .* out of valid range"):
             converter([action])
+
+
+class _ClickConverter(BaseActionConverter[tuple[str, int, int]]):
+    """Minimal converter over (kind, x, y) tuples for BaseActionConverter tests."""
+
+    @property
+    def coord_width(self) -> int:
+        return 1000
+
+    @property
+    def coord_height(self) -> int:
+        return 1000
+
+    def _convert_single_action(self, action: tuple[str, int, int]) -> list[str]:
+        kind, x, y = action
+        if kind == "noop":
+            return []
+        if kind != "click":
+            raise ValueError(f"unsupported: {kind}")
+        sx, sy = self.scale_coordinate(x, y)
+        return [f"pyautogui.click(x={sx}, y={sy})"]
+
+    def serialize_actions(self, actions):
+        return [{"kind": kind, "x": x, "y": y} for kind, x, y in actions]
+
+
+class TestBaseActionConverter:
+    def test_converts_and_skips_noops(self):
+        logger = Mock()
+        converter = _ClickConverter(logger=logger)
+
+        result = converter([("click", 500, 500), ("noop", 0, 0)])
+
+        assert result == ["pyautogui.click(x=960, y=540)"]
+        logger.debug.assert_called_once()
+
+    def test_skipped_noops_not_logged_when_debug_disabled(self):
+        logger = logging.getLogger("test.converter.quiet")
+        logger.setLevel(logging.INFO)
+        converter = _ClickConverter(logger=logger)
+
+        with patch.object(logger, "debug") as mock_debug:
+            converter([("click", 500, 500), ("noop", 0, 0)])
+
+        mock_debug.assert_not_called()
+
+    def test_converts_with_logger_without_is_enabled_for(self):
+        logger = Mock(spec=["error", "info", "debug"])
+        converter = _ClickConverter(logger=logger)
+
+        result = converter([("click", 500, 500)])
+
+        assert result == ["pyautogui.click(x=960, y=540)"]
+
+    def test_logs_with_logger_without_is_enabled_for(self):
+        logger = Mock(spec=["error", "info", "debug"])
+        converter = _ClickConverter(logger=logger)
+
+        converter([("bogus", 0, 0), ("click", 0, 0), ("noop", 0, 0)])
+
+        assert "unsupported: bogus" in logger.error.call_args.args[0]
+        logger.debug.assert_called_once()
+
+    def test_partial_failure_is_logged(self):
+        logger = Mock()
+        converter = _ClickConverter(logger=logger)
+
+        result = converter([("bogus", 0, 0), ("click", 0, 0)])
+
+        assert result == ["pyautogui.click(x=0, y=0)"]
+        assert "unsupported: bogus" in logger.error.call_args.args[0]
+
+    def test_failure_mid_batch_continues_with_remaining_actions(self):
+        logger = Mock()
+        converter = _ClickConverter(logger=logger)
+        actions = [
+            ("click", 0, 0),
+            ("bogus", 0, 0),
+            ("click", 500, 500),
+            ("noop", 0, 0),
+        ]
+
+        result = converter(actions)
+
+        assert result == ["pyautogui.click(x=0, y=0)", "pyautogui.click(x=960, y=540)"]
+        logger.error.assert_called_once()
+        logger.debug.assert_called_once()
+
+    def test_all_failed_raises(self):
+        converter = _ClickConverter()
+
+        with pytest.raises(RuntimeError, match="All action conversions failed"):
+            converter([("bogus", 0, 0)])
+
+    def test_helpers_created_lazily(self):
+        converter = _ClickConverter()
+        assert "_coord_scaler" not in vars(converter)
+        assert "caps_manager" not in vars(converter)
+
+        converter([("click", 500, 500)])
+
+        assert "_coord_scaler" in vars(converter)
+        assert converter.scale_x == pytest.approx(1.92)
+
+    @pytest.mark.parametrize(
+        "action,expected",
+        [
+            ("wait(2.5)", {"type": "sleep", "parameters": {"seconds": 2.5}}),
+            ("done", {"type": "sleep", "parameters": {"seconds": 0}}),
+            (
+                "WAIT(-1)",
+                {
+                    "type": "execute",
+                    "parameters": {"command": "WAIT(-1)", "shell": True},
+                },
+            ),
+            (
+                "PyAutoGUI.click(x=1, y=2)",
+                {
+                    "type": "pyautogui",
+                    "parameters": {"code": "PyAutoGUI.click(x=1, y=2)"},
+                },
+            ),
+        ],
+        ids=["wait", "done", "invalid-wait", "pyautogui-mixed-case"],
+    )
+    def test_action_string_to_step(self, action, expected):
+        assert _ClickConverter().action_string_to_step(action) == expected
+
+    @pytest.mark.parametrize(
+        "x,y,expected",
+        [(500, 500, (960, 540)), (1000, 1000, (1919, 1079)), (-5, 0, (0, 0))],
+        ids=["center", "max-edge", "negative"],
+    )
+    def test_scale_coordinate_matches_scaler(self, x, y, expected):
+        converter = _ClickConverter()
+        assert converter.scale_coordinate(x, y) == expected
+        assert converter._coord_scaler.scale(x, y) == expected
+
+    def test_scale_coordinate_rounds_exact_half_like_scaler(self):
+        converter = _ClickConverter(config=PyautoguiConfig(sandbox_width=1366))
+        assert converter.scale_coordinate(750, 0) == (1025, 0)
+        assert converter.scale_coordinate(750, 0) == converter._coord_scaler.scale(
+            750, 0
+        )
+
+    def test_only_noops_returns_empty(self):
+        assert _ClickConverter()([("noop", 0, 0)]) == []
@@ -192,6 +192,8 @@ class TestAsyncAgentObserver:
             assert '"message": "Test log"' in content
             # Check base64 image is in JSON data
             assert '"image": "' in content
+            assert '"action_coords": [{"type": "click", "x": 500, "y": 300}]' in content
+            assert '{"type": "type", "argument": "hello", "count": 1}' in content
 
     @pytest.mark.asyncio
     async def test_export_json(self, sample_step):
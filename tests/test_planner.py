@@ -128,6 +128,15 @@ class TestPlanner:
         assert result.success_assessment is True
         assert result.reasoning == "Task completed"
         assert request_id is None
+        assert mock_client.call_worker.call_args.kwargs["window_steps"] == [
+            {
+                "step_number": 1,
+                "action_type": "click",
+                "target": "(100, 200)",
+                "reasoning": "",
+            },
+            {"step_number": 2, "action_type": "type", "target": "", "reasoning": ""},
+        ]
 
     @pytest.mark.asyncio
     async def test_reflect_pivot_decision(self, planner, mock_client):
@@ -7,7 +7,7 @@
 # -----------------------------------------------------------------------------
 
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,7 +17,7 @@ from oagi.handler.pyautogui_action_handler import (
     PyautoguiActionHandler,
     PyautoguiConfig,
 )
-from oagi.handler.utils import configure_handler_delay
+from oagi.handler.utils import CoordinateScaler, configure_handler_delay
 from oagi.types import Action, ActionType
 
 
@@ -40,6 +40,14 @@ def handler(mock_pyautogui):
     return PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
 
 
+@pytest.fixture
+def linux_handler(mock_pyautogui):
+    # Platform-specific input functions are resolved at construction, so build
+    # the handler with the platform mocked as Linux to use pyautogui's methods
+    with patch.object(sys, "platform", "linux"):
+        return PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
+
+
 @pytest.mark.parametrize(
     "action_type,argument,expected_method,expected_coords",
     [
@@ -50,16 +58,19 @@ def handler(mock_pyautogui):
     ],
 )
 def test_coordinate_based_actions(
-    handler, mock_pyautogui, action_type, argument, expected_method, expected_coords
+    linux_handler,
+    mock_pyautogui,
+    action_type,
+    argument,
+    expected_method,
+    expected_coords,
 ):
-    # Mock platform as Linux to ensure standard methods are called (not macOS specific ones)
-    with patch.object(sys, "platform", "linux"):
-        action = Action(type=action_type, argument=argument, count=1)
-        handler([action])
+    action = Action(type=action_type, argument=argument, count=1)
+    linux_handler([action])
 
-        # Click actions now use moveTo first, then click without coordinates
-        mock_pyautogui.moveTo.assert_called_with(*expected_coords)
-        getattr(mock_pyautogui, expected_method).assert_called_once_with()
+    # Click actions now use moveTo first, then click without coordinates
+    mock_pyautogui.moveTo.assert_called_with(*expected_coords)
+    getattr(mock_pyautogui, expected_method).assert_called_once_with()
 
 
 def test_drag_action(handler, mock_pyautogui, config):
@@ -84,13 +95,11 @@ def test_hotkey_action(mock_pyautogui):
     )
 
 
-def test_type_action(handler, mock_pyautogui):
-    # Mock platform as Linux to use pyautogui.typewrite fallback
-    with patch.object(sys, "platform", "linux"):
-        action = Action(type=ActionType.TYPE, argument="Hello World", count=1)
-        handler([action])
+def test_type_action(linux_handler, mock_pyautogui):
+    action = Action(type=ActionType.TYPE, argument="Hello World", count=1)
+    linux_handler([action])
 
-        mock_pyautogui.typewrite.assert_called_once_with("Hello World")
+    mock_pyautogui.typewrite.assert_called_once_with("Hello World")
 
 
 @pytest.mark.parametrize(
@@ -116,6 +125,85 @@ def test_wait_action(handler, mock_pyautogui, config):
         mock_sleep.assert_called_once_with(config.wait_duration)
 
 
+@pytest.mark.parametrize(
+    "click_pre_delay,action_pause,expected_sleep",
+    [(0.3, 0.1, 0.2), (0.1, 0.1, None), (0.1, 0.2, None)],
+)
+def test_click_pre_delay_excludes_action_pause(
+    mock_pyautogui, click_pre_delay, action_pause, expected_sleep
+):
+    config = PyautoguiConfig(
+        click_pre_delay=click_pre_delay, action_pause=action_pause, post_batch_delay=0
+    )
+    handler = PyautoguiActionHandler(config=config)
+    with patch("time.sleep") as mock_sleep:
+        handler([Action(type=ActionType.CLICK, argument="500, 300", count=1)])
+
+    if expected_sleep is None:
+        mock_sleep.assert_not_called()
+    else:
+        mock_sleep.assert_called_once_with(pytest.approx(expected_sleep))
+
+
+@pytest.mark.parametrize(
+    "text,expect_paste",
+    [("short text", False), ("a longer block of text to paste", True)],
+)
+def test_type_pastes_text_over_threshold(mock_pyautogui, text, expect_paste):
+    config = PyautoguiConfig(paste_threshold=20, post_batch_delay=0)
+    with (
+        patch.object(sys, "platform", "linux"),
+        patch.dict(sys.modules, {"pyperclip": MagicMock()}),
+        patch("time.sleep") as mock_sleep,
+    ):
+        mock_pyperclip = sys.modules["pyperclip"]
+        mock_pyperclip.paste.return_value = "previous"
+        handler = PyautoguiActionHandler(config=config)
+        handler([Action(type=ActionType.TYPE, argument=text, count=1)])
+
+    if expect_paste:
+        mock_pyautogui.typewrite.assert_not_called()
+        mock_pyautogui.hotkey.assert_called_once_with("ctrl", "v", interval=0.1)
+        mock_sleep.assert_called_once()
+        assert [c.args for c in mock_pyperclip.copy.call_args_list] == [
+            (text,),
+            ("previous",),
+        ]
+    else:
+        mock_pyautogui.typewrite.assert_called_once_with(text)
+        mock_pyperclip.copy.assert_not_called()
+
+
+def test_type_falls_back_to_typing_without_clipboard(mock_pyautogui):
+    class PyperclipException(RuntimeError):
+        pass
+
+    mock_pyperclip = MagicMock(PyperclipException=PyperclipException)
+    mock_pyperclip.paste.side_effect = PyperclipException("no clipboard backend")
+    text = "a longer block of text to paste"
+    config = PyautoguiConfig(paste_threshold=20, post_batch_delay=0)
+    with (
+        patch.object(sys, "platform", "linux"),
+        patch.dict(sys.modules, {"pyperclip": mock_pyperclip}),
+    ):
+        handler = PyautoguiActionHandler(config=config)
+        handler([Action(type=ActionType.TYPE, argument=text, count=1)])
+
+    mock_pyautogui.typewrite.assert_called_once_with(text)
+    mock_pyautogui.hotkey.assert_not_called()
+    mock_pyperclip.copy.assert_not_called()
+
+
+def test_click_at_cursor_position_skips_move(handler, mock_pyautogui):
+    mock_pyautogui.position.return_value = (960, 324)
+    with patch("time.sleep") as mock_sleep:
+        handler([Action(type=ActionType.CLICK, argument="500, 300", count=1)])
+
+    mock_pyautogui.moveTo.assert_not_called()
+    mock_sleep.assert_not_called()
+    mock_pyautogui.click.assert_called_once_with()
+
+
 def test_hotkey_with_custom_interval(mock_pyautogui):
     custom_config = PyautoguiConfig(hotkey_interval=0.5)
     handler = PyautoguiActionHandler(config=custom_config)
@@ -155,19 +243,34 @@ class TestActionExecution:
         # Disable macos_ctrl_to_cmd to test basic hotkey functionality
         # Mock platform as Linux to use pyautogui.typewrite fallback
         config = PyautoguiConfig(macos_ctrl_to_cmd=False)
-        handler = PyautoguiActionHandler(config=config)
         actions = [
             Action(type=ActionType.CLICK, argument="100, 100", count=1),
             Action(type=ActionType.TYPE, argument="test", count=1),
             Action(type=ActionType.HOTKEY, argument="ctrl+s", count=1),
         ]
         with patch.object(sys, "platform", "linux"):
+            handler = PyautoguiActionHandler(config=config)
             handler(actions)
 
         mock_pyautogui.click.assert_called_once()
         mock_pyautogui.typewrite.assert_called_once_with("test")
         mock_pyautogui.hotkey.assert_called_once_with("ctrl", "s", interval=0.1)
 
+    def test_consecutive_type_actions_typed_once(self, linux_handler, mock_pyautogui):
+        actions = [
+            Action(type=ActionType.TYPE, argument="ab", count=1),
+            Action(type=ActionType.TYPE, argument="c", count=2),
+            Action(type=ActionType.HOTKEY, argument="enter", count=1),
+            Action(type=ActionType.TYPE, argument="d", count=1),
+        ]
+        linux_handler(actions)
+
+        assert [c.args for c in mock_pyautogui.typewrite.call_args_list] == [
+            ("abcc",),
+            ("d",),
+        ]
+        mock_pyautogui.hotkey.assert_called_once_with("enter", interval=0.1)
+
 
 class TestInputValidation:
     def test_invalid_coordinates_format(self, handler, mock_pyautogui):
@@ -196,14 +299,13 @@ class TestInputValidation:
         ],
     )
     def test_type_preserves_content(
-        self, handler, mock_pyautogui, argument, expected_text
+        self, linux_handler, mock_pyautogui, argument, expected_text
     ):
         """Quotes, spaces, and parens in type() are literal content, not delimiters."""
-        with patch.object(sys, "platform", "linux"):
-            action = Action(type=ActionType.TYPE, argument=argument, count=1)
-            handler([action])
+        action = Action(type=ActionType.TYPE, argument=argument, count=1)
+        linux_handler([action])
 
-            mock_pyautogui.typewrite.assert_called_once_with(expected_text)
+        mock_pyautogui.typewrite.assert_called_once_with(expected_text)
 
 
 class TestCapsLockManager:
@@ -321,7 +423,6 @@ class TestCornerCoordinatesHandling:
 
     def test_multiple_clicks_at_corners(self, mock_pyautogui):
         """Test multiple clicks at corner positions."""
-        handler = PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
         actions = [
             Action(type=ActionType.LEFT_DOUBLE, argument="0, 0", count=1),
             Action(type=ActionType.LEFT_TRIPLE, argument="1000, 0", count=1),
@@ -330,6 +431,7 @@ class TestCornerCoordinatesHandling:
 
         # Mock platform as Linux to ensure standard methods are called
         with patch.object(sys, "platform", "linux"):
+            handler = PyautoguiActionHandler(config=PyautoguiConfig(post_batch_delay=0))
             handler(actions)
 
             # All click actions now use moveTo first, then click without coordinates
@@ -355,10 +457,10 @@ class TestCapsLockIntegration:
 
     def test_caps_lock_session_mode(self, mock_pyautogui):
         config = PyautoguiConfig(capslock_mode="session", post_batch_delay=0)
-        handler = PyautoguiActionHandler(config=config)
 
         # Mock platform as Linux to use pyautogui.typewrite fallback
         with patch.object(sys, "platform", "linux"):
+            handler = PyautoguiActionHandler(config=config)
             # Type without caps
             type_action = Action(type=ActionType.TYPE, argument="test", count=1)
             handler([type_action])
@@ -378,7 +480,9 @@ class TestCapsLockIntegration:
 
     def test_caps_lock_system_mode(self, mock_pyautogui):
         config = PyautoguiConfig(capslock_mode="system", post_batch_delay=0)
-        handler = PyautoguiActionHandler(config=config)
+        # Mock platform as Linux to use pyautogui.typewrite fallback
+        with patch.object(sys, "platform", "linux"):
+            handler = PyautoguiActionHandler(config=config)
 
         # Toggle caps lock in system mode
         caps_action = Action(type=ActionType.HOTKEY, argument="caps", count=1)
@@ -386,13 +490,11 @@ class TestCapsLockIntegration:
         # In system mode, should call pyautogui.hotkey
         mock_pyautogui.hotkey.assert_called_once_with("capslock", interval=0.1)
 
-        # Mock platform as Linux to use pyautogui.typewrite fallback
-        with patch.object(sys, "platform", "linux"):
-            # Type action should not transform text in system mode
-            mock_pyautogui.typewrite.reset_mock()
-            type_action = Action(type=ActionType.TYPE, argument="test", count=1)
-            handler([type_action])
-            mock_pyautogui.typewrite.assert_called_with("test")
+        # Type action should not transform text in system mode
+        mock_pyautogui.typewrite.reset_mock()
+        type_action = Action(type=ActionType.TYPE, argument="test", count=1)
+        handler([type_action])
+        mock_pyautogui.typewrite.assert_called_with("test")
 
     def test_regular_hotkey_not_affected(self, mock_pyautogui):
         # Disable macos_ctrl_to_cmd to test basic hotkey functionality
@@ -530,3 +632,53 @@ class TestConfigureHandlerDelay:
         handler = DummyHandler()
         # Should not raise
         configure_handler_delay(handler, 1.0)
+
+
+class TestDeferredPostBatchDelay:
+    def test_deferred_delay_is_waited_out_before_next_screenshot(self, mock_pyautogui):
+        config = PyautoguiConfig(post_batch_delay=0.5, defer_post_batch_delay=True)
+        handler = PyautoguiActionHandler(config=config)
+        action = Action(type=ActionType.HOTKEY, argument="enter", count=1)
+
+        with (
+            patch("time.monotonic", return_value=100.0),
+            patch("time.sleep") as mock_sleep,
+        ):
+            handler([action])
+            mock_sleep.assert_not_called()
+
+            handler.wait_for_settle()
+            mock_sleep.assert_called_once_with(0.5)
+
+    def test_deferred_delay_is_tracked_per_handler(self, mock_pyautogui):
+        config = PyautoguiConfig(post_batch_delay=0.5, defer_post_batch_delay=True)
+        busy = PyautoguiActionHandler(config=config)
+        idle = AsyncPyautoguiActionHandler(config=config)
+        action = Action(type=ActionType.HOTKEY, argument="enter", count=1)
+
+        with (
+            patch("time.monotonic", return_value=100.0),
+            patch("time.sleep") as mock_sleep,
+        ):
+            busy([action])
+            idle.wait_for_settle()
+
+        mock_sleep.assert_not_called()
+
+
+class TestCoordinateScaler:
+    def test_integer_and_float_inputs_scale_alike(self):
+        scaler = CoordinateScaler(1000, 1000, 1920, 1080)
+        for value in range(0, 1001, 7):
+            assert scaler.scale(value, value) == scaler.scale(
+                float(value), float(value)
+            )
+
+    def test_integer_inputs_round_exact_halves_up(self):
+        # 750 * 1366 / 1000 is exactly 1024.5
+        scaler = CoordinateScaler(1000, 1000, 1366, 768)
+        assert scaler.scale(750, 0) == (1025, 0)
+
+    def test_whole_float_inputs_round_exact_halves_like_integers(self):
+        scaler = CoordinateScaler(1000, 1000, 1366, 768)
+        assert scaler.scale(750.0, 0.0) == scaler.scale(750, 0) == (1025, 0)
@@ -42,6 +42,21 @@ class TestScreenshotMaker:
         assert isinstance(result, PILImage)
         assert result.image is mock_resized_image
 
+    @patch("pyautogui.screenshot")
+    def test_screenshot_maker_waits_for_paired_handler(
+        self, mock_screenshot, mock_screenshot_image
+    ):
+        handler = MagicMock()
+        calls = []
+        handler.wait_for_settle.side_effect = lambda: calls.append("settle")
+        mock_screenshot.side_effect = lambda *args, **kwargs: (
+            calls.append("capture") or mock_screenshot_image[0]
+        )
+
+        ScreenshotMaker(handler=handler)()
+
+        assert calls == ["settle", "capture"]
+
     @patch("pyautogui.screenshot")
     def test_screenshot_maker_stores_last_screenshot(self, mock_screenshot):
         def create_mock_image():
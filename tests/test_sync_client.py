@@ -6,15 +6,28 @@
 #  Licensed under the MIT License.
 # -----------------------------------------------------------------------------
 
+import json
 import os
+import time
+from collections import deque
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 from oagi.client import SyncClient
-from oagi.constants import MODEL_ACTOR
+from oagi.constants import (
+    MODEL_ACTOR,
+    PRESIGNED_URL_BURST_WINDOW,
+    PRESIGNED_URL_POOL_SIZE,
+    UPLOAD_CHUNK_SIZE,
+)
 from oagi.exceptions import (
+    APIError,
     ConfigurationError,
+    NetworkError,
+    NotFoundError,
+    RequestTimeoutError,
 )
 from oagi.types import Step
 from oagi.types.models import (
@@ -106,6 +119,18 @@ class TestSyncClientInit:
         client = create_client(base_url="https://api.example.com/", api_key="test-key")
         assert client.base_url == "https://api.example.com"
 
+    def test_build_headers_cached_per_api_version(self, test_client, api_env):
+        headers = test_client._build_headers()
+        versioned = test_client._build_headers("v2")
+
+        assert headers["x-api-key"] == api_env["api_key"]
+        assert "x-api-version" not in headers
+        assert versioned["x-api-version"] == "v2"
+        assert test_client._build_headers() is headers
+        assert test_client._build_headers("v2") is versioned
+        with pytest.raises(TypeError):
+            headers["x-api-version"] = "v3"
+
 
 class TestSyncClientChatCompletion:
     def test_chat_completion_success(
@@ -205,6 +230,19 @@ class TestSyncClientChatCompletion:
         call_args = test_client.openai_client.chat.completions.create.call_args
         assert call_args[1]["temperature"] == 0.7
 
+    def test_chat_completion_kwargs_do_not_leak_between_calls(self, test_client):
+        first = test_client._build_chat_completion_kwargs(
+            MODEL_ACTOR, [{"role": "user", "content": "one"}], 0.7, task_id="t1"
+        )
+        second = test_client._build_chat_completion_kwargs(
+            MODEL_ACTOR, [{"role": "user", "content": "two"}], 0.7
+        )
+
+        assert first["messages"][0]["content"] == "one"
+        assert second["messages"][0]["content"] == "two"
+        assert second["temperature"] == 0.7
+        assert "extra_body" not in second
+
 
 class TestSyncClientS3Upload:
     def test_get_s3_presigned_url(self, test_client, upload_file_response):
@@ -219,6 +257,28 @@ class TestSyncClientS3Upload:
         assert result.url == upload_file_response["url"]
         assert result.download_url == upload_file_response["download_url"]
 
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (httpx.ConnectTimeout("timed out"), RequestTimeoutError),
+            (httpx.ConnectError("refused"), NetworkError),
+            (
+                httpx.HTTPStatusError(
+                    "not found",
+                    request=httpx.Request("GET", "https://api.example.com"),
+                    response=httpx.Response(404),
+                ),
+                NotFoundError,
+            ),
+        ],
+        ids=["timeout", "network", "status"],
+    )
+    def test_get_s3_presigned_url_maps_http_errors(self, test_client, error, expected):
+        test_client.http_client.get = Mock(side_effect=error)
+
+        with pytest.raises(expected):
+            test_client.get_s3_presigned_url()
+
     def test_upload_to_s3(self, test_client):
         mock_response = Mock()
         mock_response.status_code = 200
@@ -232,6 +292,48 @@ class TestSyncClientS3Upload:
 
         test_client.upload_client.put.assert_called_once()
 
+    def test_upload_to_s3_omits_sdk_headers(self, api_env):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200)
+
+        with (
+            patch("oagi.client.sync.OpenAI"),
+            patch(
+                "oagi.client.sync.HTTPTransport",
+                return_value=httpx.MockTransport(handler),
+            ),
+        ):
+            client = SyncClient(
+                base_url=api_env["base_url"], api_key=api_env["api_key"]
+            )
+
+        client.upload_to_s3(
+            url="https://s3.amazonaws.com/presigned-url", content=b"image bytes"
+        )
+        client.close()
+
+        assert len(requests) == 1
+        assert not any(name.startswith("x-sdk-") for name in requests[0].headers)
+
+    def test_upload_to_s3_streams_chunks(self, test_client):
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        test_client.upload_client.put = Mock(return_value=mock_response)
+        content = b"x" * (UPLOAD_CHUNK_SIZE + 10)
+
+        test_client.upload_to_s3(
+            url="https://s3.amazonaws.com/presigned-url", content=content
+        )
+
+        call_kwargs = test_client.upload_client.put.call_args.kwargs
+        chunks = list(call_kwargs["content"])
+        assert [len(c) for c in chunks] == [UPLOAD_CHUNK_SIZE, 10]
+        assert b"".join(chunks) == content
+        assert call_kwargs["headers"] == {"Content-Length": str(len(content))}
+
     def test_put_s3_presigned_url(self, test_client, upload_file_response):
         mock_get_response = Mock()
         mock_get_response.status_code = 200
@@ -248,6 +350,141 @@ class TestSyncClientS3Upload:
         assert isinstance(result, UploadFileResponse)
         assert result.download_url == upload_file_response["download_url"]
 
+    def test_put_s3_presigned_url_prefetches_urls_in_burst(
+        self, test_client, upload_file_response
+    ):
+        mock_get_response = Mock()
+        mock_get_response.status_code = 200
+        mock_get_response.json.return_value = upload_file_response
+        test_client.http_client.get = Mock(return_value=mock_get_response)
+        test_client.upload_client.put = Mock(return_value=Mock())
+
+        test_client.put_s3_presigned_url(screenshot=b"image bytes")
+        test_client.put_s3_presigned_url(screenshot=b"image bytes")
+        test_client._upload_executor.shutdown(wait=True)
+
+        assert test_client.http_client.get.call_count == 2 + PRESIGNED_URL_POOL_SIZE
+        assert len(test_client._url_pool[None]) == PRESIGNED_URL_POOL_SIZE
+
+    def test_put_s3_presigned_url_skips_prefetch_outside_burst(
+        self, test_client, upload_file_response
+    ):
+        test_client._last_upload_at[None] = (
+            time.monotonic() - PRESIGNED_URL_BURST_WINDOW - 1
+        )
+        mock_get_response = Mock()
+        mock_get_response.status_code = 200
+        mock_get_response.json.return_value = upload_file_response
+        test_client.http_client.get = Mock(return_value=mock_get_response)
+        test_client.upload_client.put = Mock(return_value=Mock())
+
+        test_client.put_s3_presigned_url(screenshot=b"image bytes")
+        test_client._upload_executor.shutdown(wait=True)
+
+        test_client.http_client.get.assert_called_once()
+        assert not test_client._url_pool.get(None)
+
+    def test_put_s3_presigned_url_uses_pooled_url(
+        self, test_client, upload_file_response
+    ):
+        pooled = UploadFileResponse(
+            **{**upload_file_response, "expires_at": int(time.time()) + 600}
+        )
+        test_client._url_pool[None] = deque([pooled])
+        test_client.http_client.get = Mock()
+        test_client.upload_client.put = Mock(return_value=Mock())
+
+        result = test_client.put_s3_presigned_url(screenshot=b"image bytes")
+
+        assert result is pooled
+        test_client.http_client.get.assert_not_called()
+
+    def test_put_s3_presigned_url_skips_expired_pooled_url(
+        self, test_client, upload_file_response
+    ):
+        stale = UploadFileResponse(
+            **{**upload_file_response, "expires_at": int(time.time()) - 1}
+        )
+        test_client._url_pool[None] = deque([stale])
+        mock_get_response = Mock()
+        mock_get_response.status_code = 200
+        mock_get_response.json.return_value = upload_file_response
+        test_client.http_client.get = Mock(return_value=mock_get_response)
+        test_client.upload_client.put = Mock(return_value=Mock())
+
+        result = test_client.put_s3_presigned_url(screenshot=b"image bytes")
+
+        assert result is not stale
+        test_client.http_client.get.assert_called_once()
+        assert not test_client._url_pool[None]
+
+    def test_prefetch_presigned_urls_swallows_network_errors(self, test_client):
+        test_client._url_pool[None] = deque()
+        test_client._url_prefetching.add(None)
+        test_client.http_client.get = Mock(
+            side_effect=httpx.ConnectError("Connection failed")
+        )
+
+        test_client._prefetch_presigned_urls(None)
+
+        assert not test_client._url_pool[None]
+        assert None not in test_client._url_prefetching
+
+
+class TestSyncClientWorker:
+    def test_call_worker_sends_json_body(self, test_client):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"X-Request-ID": "req-1"}
+        mock_response.json.return_value = {
+            "response": "ok",
+            "prompt_tokens": 1,
+            "completion_tokens": 2,
+        }
+        test_client.http_client.post = Mock(return_value=mock_response)
+
+        result = test_client.call_worker(
+            worker_id="oagi_first",
+            overall_todo="todo ✓",
+            task_description="task",
+            todos=[],
+        )
+
+        assert result.response == "ok"
+        call_kwargs = test_client.http_client.post.call_args.kwargs
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+        body = json.loads(call_kwargs["content"])
+        assert body["external_worker_id"] == "oagi_first"
+        assert body["overall_todo"] == "todo ✓"
+
+
+class TestSyncClientWorkerBatch:
+    def test_call_workers_batch_preserves_order(self, test_client):
+        def fake_call_worker(**kwargs):
+            time.sleep(0.01 if kwargs["overall_todo"] == "first" else 0)
+            return kwargs["overall_todo"]
+
+        test_client.call_worker = Mock(side_effect=fake_call_worker)
+        requests = [
+            {"worker_id": "oagi_first", "overall_todo": todo}
+            for todo in ("first", "second", "third")
+        ]
+
+        results = test_client.call_workers_batch(requests)
+
+        assert results == ["first", "second", "third"]
+        assert test_client.call_worker.call_count == 3
+
+    def test_call_workers_batch_propagates_error(self, test_client):
+        test_client.call_worker = Mock(side_effect=APIError("boom"))
+
+        with pytest.raises(APIError, match="boom"):
+            test_client.call_workers_batch([{"worker_id": "oagi_first"}])
+
+    def test_call_workers_batch_rejects_invalid_concurrency(self, test_client):
+        with pytest.raises(ValueError, match="concurrency"):
+            test_client.call_workers_batch([], concurrency=0)
+
 
 class TestSyncClientContextManager:
     def test_context_manager(self, api_env):